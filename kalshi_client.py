@@ -60,7 +60,8 @@ class KalshiClient:
              status_forcelist=[429, 500, 502, 503, 504],
              allowed_methods=["GET", "POST", "PUT", "DELETE"]
          )
-         adapter = HTTPAdapter(max_retries=retries)
+         # Pool sized for the threaded callers (e.g. Movers' live fetch) so connections are reused
+         adapter = HTTPAdapter(max_retries=retries, pool_connections=20, pool_maxsize=20)
          self.session.mount("https://", adapter)
          self.session.mount("http://", adapter)
          
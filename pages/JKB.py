@@ -4,6 +4,7 @@ import streamlit as st
 import pandas as pd
 import datetime
 import altair as alt
+import pyarrow as pa
 from requests.exceptions import HTTPError
 import os
 import duckdb
@@ -566,6 +567,98 @@ def create_clean_positions_table(positions_df: pd.DataFrame) -> pd.DataFrame:
     
     return display_df[column_order]
 
+@st.cache_data(show_spinner=False)
+def positions_to_arrow(positions_df: pd.DataFrame) -> pa.Table:
+    """Convert the positions display table to Arrow once per distinct frame"""
+    return pa.Table.from_pandas(positions_df, preserve_index=False)
+
+@st.fragment
+def _positions_panel(positions_df: pd.DataFrame, positions_with_pnl: pd.DataFrame):
+    """Current positions table; searching reruns only this panel"""
+    st.header("Current Positions")
+    
+    if not positions_df.empty:
+        # Create clean positions table
+        clean_positions = create_clean_positions_table(positions_with_pnl)
+        
+        # Add search functionality
+        search_term = st.text_input("Search by ticker:", placeholder="e.g., BIDEN-2024")
+        
+        if search_term:
+            filtered_positions = clean_positions[
+                clean_positions['ticker'].str.contains(search_term.upper(), na=False)
+            ]
+        else:
+            filtered_positions = clean_positions
+        
+        # Filter out positions with zero contracts
+        filtered_positions = filtered_positions[filtered_positions['position'] != 0]
+
+        # Hand Streamlit an Arrow table directly; Status carries the PnL signal
+        st.dataframe(
+            positions_to_arrow(filtered_positions),
+            column_config={
+                'ticker': st.column_config.TextColumn("Market", width="medium"),
+                'position_direction': st.column_config.TextColumn("Side", width="small"),
+                'position': st.column_config.NumberColumn("Contracts", width="small"),
+                'position_size': st.column_config.TextColumn("Size", width="small"),
+                'total_traded_dollars': st.column_config.NumberColumn("Total Traded ($)", format="$%.2f"),
+                'realized_pnl_dollars': st.column_config.NumberColumn("Realized PnL ($)", format="$%.2f"),
+                'unrealized_pnl_dollars': st.column_config.NumberColumn("Unrealized PnL ($)", format="$%.2f"),
+                'total_pnl_dollars': st.column_config.NumberColumn("Total PnL ($)", format="$%.2f"),
+                'pnl_status': st.column_config.TextColumn("Status", width="small"),
+                'fees_paid_dollars': st.column_config.NumberColumn("Fees ($)", format="$%.2f"),
+                'resting_orders_count': st.column_config.NumberColumn("Orders", width="small")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Add export functionality
+        if not filtered_positions.empty:
+            csv = filtered_positions.to_csv(index=False)
+            st.download_button(
+                label="Download Positions CSV",
+                data=csv,
+                file_name=f"kalshi_positions_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv"
+            )
+    else:
+        st.info("No active positions found")
+
+@st.fragment
+def _fills_panel(fills_df: pd.DataFrame):
+    """Recent fills table, rendered as its own fragment"""
+    st.header("Recent 10 Fills")
+    
+    if not fills_df.empty:
+        try:
+            recent_fills_table = create_recent_fills_table(fills_df)
+            if not recent_fills_table.empty:
+                st.dataframe(
+                    recent_fills_table,
+                    column_config={
+                        'Date': st.column_config.DatetimeColumn("Date", format="MM/DD/YY HH:mm"),
+                        'Market': st.column_config.TextColumn("Market", width="medium"),
+                        'Side': st.column_config.TextColumn("Side", width="small"),
+                        'Action': st.column_config.TextColumn("Action", width="small"),
+                        'Count': st.column_config.NumberColumn("Count", width="small"),
+                        'YES Price ($)': st.column_config.NumberColumn("YES Price ($)", format="$%.2f"),
+                        'NO Price ($)': st.column_config.NumberColumn("NO Price ($)", format="$%.2f"),
+                        'Fill Size ($)': st.column_config.NumberColumn("Fill Size ($)", format="$%.2f")
+                    },
+                    hide_index=True,
+                    use_container_width=True
+                )
+            else:
+                st.info("No recent fills data to display")
+        except Exception as e:
+            st.error(f"Error creating recent fills table: {str(e)}")
+            st.write("Raw fills data (first 5 rows):")
+            st.dataframe(fills_df.head())
+    else:
+        st.info("No fills data available")
+
 def main():
     # Page title and description (no set_page_config needed for pages)
     st.title("JKB Portfolio Dashboard")
@@ -736,109 +829,11 @@ def main():
     st.markdown("---")
     
     # MIDDLE SECTION: Current Positions (Full Width)
-    st.header("Current Positions")
-    
-    if not positions_df.empty:
-        # Create clean positions table
-        clean_positions = create_clean_positions_table(positions_with_pnl)
-        
-        # Add search functionality
-        search_term = st.text_input("Search by ticker:", placeholder="e.g., BIDEN-2024")
-        
-        if search_term:
-            filtered_positions = clean_positions[
-                clean_positions['ticker'].str.contains(search_term.upper(), na=False)
-            ]
-        else:
-            filtered_positions = clean_positions
-        
-        # Filter out positions with zero contracts
-        filtered_positions = filtered_positions[filtered_positions['position'] != 0]
-
-        # Create color styling for PnL-based shading
-        def color_pnl(val):
-            if pd.isna(val):
-                return ''
-            # Light green for profitable, light red for loss, very light for neutral
-            if val > 0:
-                # Light green - very subtle
-                return f'background-color: rgba(144, 238, 144, 0.15)'
-            elif val < 0:
-                # Light red - very subtle
-                return f'background-color: rgba(255, 182, 193, 0.15)'
-            else:
-                # Very light gray for neutral
-                return f'background-color: rgba(211, 211, 211, 0.1)'
-        
-        # Apply styling to the dataframe
-        styled_positions = filtered_positions.style.map(
-            color_pnl, 
-            subset=['total_pnl_dollars']
-        )
-        
-        # Display the enhanced table with styling
-        st.dataframe(
-            styled_positions,
-            column_config={
-                'ticker': st.column_config.TextColumn("Market", width="medium"),
-                'position_direction': st.column_config.TextColumn("Side", width="small"),
-                'position': st.column_config.NumberColumn("Contracts", width="small"),
-                'position_size': st.column_config.TextColumn("Size", width="small"),
-                'total_traded_dollars': st.column_config.NumberColumn("Total Traded ($)", format="$%.2f"),
-                'realized_pnl_dollars': st.column_config.NumberColumn("Realized PnL ($)", format="$%.2f"),
-                'unrealized_pnl_dollars': st.column_config.NumberColumn("Unrealized PnL ($)", format="$%.2f"),
-                'total_pnl_dollars': st.column_config.NumberColumn("Total PnL ($)", format="$%.2f"),
-                'pnl_status': st.column_config.TextColumn("Status", width="small"),
-                'fees_paid_dollars': st.column_config.NumberColumn("Fees ($)", format="$%.2f"),
-                'resting_orders_count': st.column_config.NumberColumn("Orders", width="small")
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-        
-        # Add export functionality
-        if not filtered_positions.empty:
-            csv = filtered_positions.to_csv(index=False)
-            st.download_button(
-                label="Download Positions CSV",
-                data=csv,
-                file_name=f"kalshi_positions_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                mime="text/csv"
-            )
-    else:
-        st.info("No active positions found")
+    _positions_panel(positions_df, positions_with_pnl)
     
     # RECENT FILLS SECTION: Below Current Positions
     st.markdown("---")
-    st.header("Recent 10 Fills")
-    
-    if not fills_df.empty:
-        try:
-            recent_fills_table = create_recent_fills_table(fills_df)
-            if not recent_fills_table.empty:
-                st.dataframe(
-                    recent_fills_table,
-                    column_config={
-                        'Date': st.column_config.DatetimeColumn("Date", format="MM/DD/YY HH:mm"),
-                        'Market': st.column_config.TextColumn("Market", width="medium"),
-                        'Side': st.column_config.TextColumn("Side", width="small"),
-                        'Action': st.column_config.TextColumn("Action", width="small"),
-                        'Count': st.column_config.NumberColumn("Count", width="small"),
-                        'YES Price ($)': st.column_config.NumberColumn("YES Price ($)", format="$%.2f"),
-                        'NO Price ($)': st.column_config.NumberColumn("NO Price ($)", format="$%.2f"),
-                        'Fill Size ($)': st.column_config.NumberColumn("Fill Size ($)", format="$%.2f")
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
-            else:
-                st.info("No recent fills data to display")
-        except Exception as e:
-            st.error(f"Error creating recent fills table: {str(e)}")
-            st.write("Raw fills data (first 5 rows):")
-            st.dataframe(fills_df.head())
-    else:
-        st.info("No fills data available")
+    _fills_panel(fills_df)
     
     # Add refresh button and timestamp at the bottom
     st.markdown("---")
@@ -846,8 +841,8 @@ def main():
     refresh_col1, refresh_col2, refresh_col3 = st.columns([1, 2, 1])
     
     with refresh_col2:
-        if st.button("Refresh Data", type="primary", use_container_width=True):
-            st.rerun()
+        # The click itself reruns the page and re-fetches portfolio data
+        st.button("Refresh Data", type="primary", use_container_width=True)
     
     with refresh_col3:
         st.markdown(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
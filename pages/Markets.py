@@ -12,9 +12,8 @@ try:
     from utils import (
         get_unified_markets, 
         get_markets_by_source, 
-        get_volume_columns, 
-        make_ticker_clickable, 
-        make_title_clickable
+        get_volume_columns,
+        top_k_rows
     )
     UTILS_AVAILABLE = True
 except ImportError as e:
@@ -27,10 +26,9 @@ except ImportError as e:
         return pd.DataFrame()
     def get_volume_columns(df):
         return pd.Series(0, index=df.index), pd.Series(0, index=df.index)
-    def make_ticker_clickable(ticker, display_text=None, key=None):
-        return False
-    def make_title_clickable(title, ticker=None, key=None):
-        return False
+    def top_k_rows(df, values, n):
+        arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=0.0)
+        return df.iloc[np.argsort(-arr, kind="stable")[:n]]
 
 try:
     from shared_sidebar import render_shared_sidebar, get_selected_data_sources, get_selected_data_source_display
@@ -47,16 +45,214 @@ except ImportError as e:
     def get_selected_data_source_display():
         return "Kalshi (default)"
 
-# Safe imports for other dependencies
-try:
-    import duckdb
-    DUCKDB_AVAILABLE = True
-except ImportError:
-    DUCKDB_AVAILABLE = False
-    duckdb = None
+TOP_N = 20  # Show top 20 markets
+KALSHI_PRICE_COLS = ("yes_bid", "yes_ask", "no_bid", "no_ask", "last_price")  # Integer cents (0-100)
+TITLE_MAX_LEN = 60  # Truncate long titles to single-line friendly length
+
+def _truncate(s: pd.Series, n: int = TITLE_MAX_LEN, suffix: str = "...") -> pd.Series:
+    """Shorten strings longer than n characters, ending them with suffix (Arrow string kernels)."""
+    titles = s.fillna("").astype("string[pyarrow]")
+    return (titles.str.slice(0, n - len(suffix)) + suffix).where(titles.str.len() > n, titles)
+
+# Display label for each raw market column; Kalshi and Polymarket spellings share a label
+DISPLAY_RENAME = {
+    "_title_short": "Title",
+    "ticker": "Ticker",
+    "market_id": "Ticker",
+    "outcomes": "Outcomes",
+    "yes_sub_title": "Yes Subtitle",
+    "no_sub_title": "No Subtitle",
+    "yes_bid": "Yes Bid",
+    "yes_ask": "Yes Ask",
+    "no_bid": "No Bid",
+    "no_ask": "No Ask",
+    "last_price": "Last Price",
+    "_vol24": "Volume (24h)",
+    "_total_vol": "Total Volume",
+    "status": "Status",
+    "close_time": "Close Time",
+}
+
+# Values shown when a column is missing from the source frame altogether
+MISSING_COLUMN_DEFAULTS = {"outcomes": "N/A", "status": "Unknown", "yes_sub_title": "", "no_sub_title": ""}
+
+# Raw columns shown in each table, per data source
+TOP_COLS = {
+    "kalshi": ["Series", "_title_short", "ticker", "yes_bid", "yes_ask", "no_bid", "no_ask", "last_price", "_vol24", "_total_vol", "close_time"],
+    "polymarket": ["Series", "_title_short", "ticker", "outcomes", "yes_bid", "yes_ask", "last_price", "_vol24", "_total_vol", "status"],
+}
+SUMMARY_COLS = {
+    "kalshi": ["Series", "_title_short", "ticker", "yes_sub_title", "no_sub_title", "yes_ask", "no_ask", "last_price", "_vol24", "_total_vol", "close_time"],
+    "polymarket": ["Series", "_title_short", "ticker", "outcomes", "yes_ask", "last_price", "_vol24", "_total_vol", "status"],
+}
+SEARCH_COLS = {
+    "kalshi": ["Series", "_title_short", "ticker", "yes_ask", "no_ask", "last_price", "_vol24", "_total_vol"],
+    "polymarket": ["Series", "_title_short", "ticker", "outcomes", "yes_ask", "last_price", "_vol24", "_total_vol"],
+}
+
+# Money formats per data source (Kalshi quotes in cents, Polymarket in dollars);
+# columns a table doesn't show are skipped
+MONEY_FMT = {
+    "kalshi": {
+        "Yes Bid": "${:,.0f}",
+        "Yes Ask": "${:,.0f}",
+        "No Bid": "${:,.0f}",
+        "No Ask": "${:,.0f}",
+        "Last Price": "${:,.0f}",
+        "Volume (24h)": "${:,.0f}",
+        "Total Volume": "${:,.0f}",
+    },
+    "polymarket": {
+        "Yes Bid": "${:,.3f}",
+        "Yes Ask": "${:,.3f}",
+        "Last Price": "${:,.3f}",
+        "Volume (24h)": "${:,.0f}",
+        "Total Volume": "${:,.0f}",
+    },
+}
 
-import urllib.parse
-import os
+def _data_source(df: pd.DataFrame) -> str:
+    """'polymarket' when the frame's first row is a Polymarket market, else 'kalshi'."""
+    if 'data_source' in df.columns and df['data_source'].iloc[0] == 'polymarket':
+        return "polymarket"
+    return "kalshi"
+
+def _project(rows: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Select display columns in one projection and relabel them; absent columns come back empty."""
+    ticker_col = 'ticker' if 'ticker' in rows.columns else 'market_id'
+    raw = [ticker_col if col == "ticker" else col for col in columns]
+    out = rows.reindex(columns=raw)
+    for col, default in MISSING_COLUMN_DEFAULTS.items():
+        if col in raw and col not in rows.columns:
+            out[col] = default
+    out.columns = [DISPLAY_RENAME.get(col, col) for col in raw]
+    return out
+
+def _format_money_columns(df: pd.DataFrame, formats: dict) -> pd.DataFrame:
+    """Render the given columns as pre-formatted strings (blank when missing) instead of using Styler."""
+    out = df.copy()
+    for col, fmt in formats.items():
+        if col in out.columns:
+            out[col] = pd.to_numeric(out[col], errors="coerce").map(fmt.format, na_action="ignore").fillna("")
+    return out
+
+def _downcast_kalshi(df: pd.DataFrame) -> None:
+    """Store Kalshi cent prices as Int16 and volumes as Int64, leaving non-integral columns unchanged."""
+    for col, dtype in [(c, "Int16") for c in KALSHI_PRICE_COLS] + [("_vol24", "Int64"), ("_total_vol", "Int64")]:
+        if col in df.columns:
+            try:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+            except (TypeError, ValueError):
+                pass
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_markets(selected_sources: tuple) -> pd.DataFrame:
+    """Load markets for the selected data sources; reruns are served from the cache."""
+    if len(selected_sources) > 1:
+        # Multiple sources - use unified function
+        df = get_unified_markets(list(selected_sources))
+    else:
+        # Single source - use source-specific function
+        df = get_markets_by_source(selected_sources[0])
+    
+    # Arrow-backed strings so length/slice/contains run as vectorized kernels
+    for col in ("title", "ticker", "market_id", "yes_sub_title", "no_sub_title"):
+        if col in df.columns:
+            df[col] = df[col].astype("string[pyarrow]")
+    
+    # Few distinct series across thousands of markets: store as integer codes
+    if "Series" in df.columns:
+        df["Series"] = df["Series"].astype("category")
+    
+    # Truncate titles once here so every table (and every search) reuses them,
+    # and keep a lowercased copy so searches don't re-lower the full column
+    title_col = 'title' if 'title' in df.columns else 'Title'
+    if title_col in df.columns:
+        df["_title_short"] = _truncate(df[title_col])
+        df["_title_lower"] = df[title_col].astype("string[pyarrow]").str.lower()
+    
+    # Resolve volume columns once (handle both Kalshi and Polymarket data structures)
+    if not df.empty:
+        vol24_series, total_vol_series = get_volume_columns(df)
+        df["_vol24"] = 0 if vol24_series is None or vol24_series.empty else vol24_series
+        df["_total_vol"] = 0 if total_vol_series is None or total_vol_series.empty else total_vol_series
+    
+    # Polymarket prices are fractional dollars, so only Kalshi-only frames are downcast
+    if set(selected_sources) == {"kalshi"}:
+        _downcast_kalshi(df)
+    return df
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _build_top_tables(_df: pd.DataFrame, df_key: tuple):
+    """
+    Build the top-by-24h-volume and top-by-total-volume display frames.
+    
+    Memoized on df_key (sources, row count, last ticker), so reruns triggered by
+    the search box reuse the frames instead of rebuilding them.
+    
+    Returns:
+        (df_top_display, top_source, df_sum_display, sum_source), where the
+        sources are 'kalshi' or 'polymarket'
+    """
+    df = _df
+    
+    # Select top N by 24h volume without sorting the full frame
+    df_top = top_k_rows(df, df["_vol24"], TOP_N)
+    
+    # Show clean dataframe with the columns for this data source
+    top_source = _data_source(df_top)
+    df_top_display = _project(df_top, TOP_COLS[top_source])
+    
+    # Rank by Total Volume first so the summary frame is only built for the 10 rows shown.
+    # When every market already fits in the top table, rank within it instead of rescanning df.
+    df_sum_source = df_top if len(df) <= TOP_N else df
+    df_sum_rows = top_k_rows(df_sum_source, df_sum_source["_total_vol"], 10)
+    
+    # Build summary DataFrame based on data source
+    sum_source = _data_source(df)
+    df_sum_display = _project(df_sum_rows, SUMMARY_COLS[sum_source])
+    
+    return df_top_display, top_source, df_sum_display, sum_source
+
+@st.fragment
+def _search_panel(df: pd.DataFrame):
+    """Search box and results; typing reruns only this fragment, not the top tables."""
+    st.subheader("🔍 Search Markets")
+    
+    # Search by title; the form only sends the query on submit (button or Enter),
+    # so typing doesn't rerun the filter per keystroke
+    with st.form("market_search"):
+        search_term = st.text_input("Search markets by title:", placeholder="Enter part of a market title...")
+        st.form_submit_button("Search")
+    
+    title_col = 'title' if 'title' in df.columns else 'Title'
+    
+    if search_term and len(search_term.strip()) < 2:
+        st.caption("Enter at least 2 characters to search.")
+    elif search_term:
+        # Filter markets by search term: plain substring match on the
+        # pre-lowered titles (no regex engine)
+        if "_title_lower" in df.columns:
+            filt = df["_title_lower"].str.contains(search_term.lower(), regex=False, na=False)
+        else:
+            filt = df[title_col].str.contains(search_term, case=False, regex=False, na=False)
+        df_search = df.iloc[np.flatnonzero(filt.to_numpy(dtype=bool, na_value=False))]
+        
+        if not df_search.empty:
+            st.success(f"Found {len(df_search)} markets matching '{search_term}'")
+            
+            # Build display df based on data source
+            search_source = _data_source(df_search)
+            df_search_display = _project(df_search, SEARCH_COLS[search_source])
+            
+            # Apply formatting based on data source
+            st.dataframe(
+                _format_money_columns(df_search_display, MONEY_FMT[search_source]),
+                use_container_width=True,
+                hide_index=True,
+            )
+        else:
+            st.warning(f"No markets found matching '{search_term}'")
 
 def main():
     # Page title and description (no set_page_config needed for pages)
@@ -80,321 +276,48 @@ def main():
     
     # ── Load Data ───────────────────────────────────────────────────────────
     with st.spinner(f"Loading {data_source_display} market data..."):
-        # Load markets based on selected data source
-        if len(selected_sources) > 1:
-            # Multiple sources - use unified function
-            df = get_unified_markets(selected_sources)
-        else:
-            # Single source - use source-specific function
-            df = get_markets_by_source(selected_sources[0])
+        # Load markets based on selected data source (cached across reruns)
+        df = _load_markets(tuple(selected_sources))
         
         if df.empty:
             st.error(f"Could not load {data_source_display} markets data. Please check your data refresh.")
             return
         
-        # Get volume columns (handle both Kalshi and Polymarket data structures)
-        vol24_series, total_vol_series = get_volume_columns(df)
-        
-        # Ensure volume series are not None and have proper indices
-        if vol24_series is None or vol24_series.empty:
-            vol24_series = pd.Series(0, index=df.index)
-        if total_vol_series is None or total_vol_series.empty:
-            total_vol_series = pd.Series(0, index=df.index)
+        # Cheap cache key so the derived tables invalidate when the data refreshes
+        ticker_col = 'ticker' if 'ticker' in df.columns else 'market_id'
+        df_key = (tuple(selected_sources), len(df), str(df[ticker_col].iloc[-1]) if ticker_col in df.columns else "")
         
         # ── Data Source Indicator ──────────────────────────────────────────
         st.info(f"📊 Showing data from: **{data_source_display}** ({len(df)} markets)")
         
         # ── Top Markets by 24h Volume ───────────────────────────────────────
-        # Get top markets by 24h volume
-        n = 20  # Show top 20 markets
+        df_top_display, top_source, df_sum_display, sum_source = _build_top_tables(df, df_key)
         
-        # Sort by 24h volume and get top N
-        df_sorted = df.assign(_vol24=vol24_series).sort_values("_vol24", ascending=False).head(n)
-        df_top = df_sorted.drop(columns=["_vol24"])
-        
-        # Get volume columns for top markets - ensure indices match
-        try:
-            vol24_top = vol24_series.loc[df_top.index]
-            total_vol_top = total_vol_series.loc[df_top.index]
-        except (KeyError, AttributeError):
-            # Fallback if indices don't match
-            vol24_top = pd.Series(0, index=df_top.index)
-            total_vol_top = pd.Series(0, index=df_top.index)
-
-        st.subheader(f"Top {n} Markets by 24h Volume")
-        
-        # Handle different column names for different data sources
-        title_col = 'title' if 'title' in df_top.columns else 'Title'
-        ticker_col = 'ticker' if 'ticker' in df_top.columns else 'market_id'
-        yes_bid_col = 'yes_bid' if 'yes_bid' in df_top.columns else 'Yes Bid'
-        yes_ask_col = 'yes_ask' if 'yes_ask' in df_top.columns else 'Yes Ask'
-        
-        # Handle Polymarket vs Kalshi differences
-        if 'data_source' in df_top.columns and df_top['data_source'].iloc[0] == 'polymarket':
-            # Polymarket data - no no_bid/no_ask columns
-            no_bid_col = None
-            no_ask_col = None
-            # Use outcomes instead
-            outcomes_col = 'outcomes' if 'outcomes' in df_top.columns else None
-        else:
-            # Kalshi data - has no_bid/no_ask columns
-            no_bid_col = 'no_bid' if 'no_bid' in df_top.columns else 'No Bid'
-            no_ask_col = 'no_ask' if 'no_ask' in df_top.columns else 'No Ask'
-            outcomes_col = None
-        
-        last_price_col = 'last_price' if 'last_price' in df_top.columns else 'Last Price'
-        close_time_col = 'close_time' if 'close_time' in df_top.columns else 'Close Time'
-        
-        # Build display DataFrame based on data source
-        if 'data_source' in df_top.columns and df_top['data_source'].iloc[0] == 'polymarket':
-            # Polymarket display - simpler structure
-            df_top_display = pd.DataFrame({
-                "Series":        df_top.get("Series", pd.Series(index=df_top.index, dtype=object)),
-                "Title":         df_top.get(title_col),
-                "Ticker":        df_top.get(ticker_col),
-                "Outcomes":      df_top.get(outcomes_col, "N/A"),
-                "Yes Bid":       df_top.get(yes_bid_col),
-                "Yes Ask":       df_top.get(yes_ask_col),
-                "Last Price":    df_top.get(last_price_col),
-                "Volume (24h)":  vol24_top,
-                "Total Volume":  total_vol_top,
-                "Status":        df_top.get('status', 'Unknown'),
-            })
-            
-            # Select columns for Polymarket
-            display_columns = ["Series", "Title", "Ticker", "Outcomes", "Yes Bid", "Yes Ask", "Last Price", "Volume (24h)", "Total Volume", "Status"]
-        else:
-            # Kalshi display - full structure
-            df_top_display = pd.DataFrame({
-                "Series":        df_top.get("Series", pd.Series(index=df_top.index, dtype=object)),
-                "Title":         df_top.get(title_col),
-                "Ticker":        df_top.get(ticker_col),
-                "Yes Bid":       df_top.get(yes_bid_col),
-                "Yes Ask":       df_top.get(yes_ask_col),
-                "No Bid":        df_top.get(no_bid_col),
-                "No Ask":        df_top.get(no_ask_col),
-                "Last Price":    df_top.get(last_price_col),
-                "Volume (24h)":  vol24_top,
-                "Total Volume":  total_vol_top,
-                "Close Time":    df_top.get(close_time_col),
-            })
-            
-            # Select columns for Kalshi
-            display_columns = ["Series", "Title", "Ticker", "Yes Bid", "Yes Ask", "No Bid", "No Ask", "Last Price", "Volume (24h)", "Total Volume", "Close Time"]
-        
-        # Truncate long titles to single-line friendly length
-        if "Title" in df_top_display.columns:
-            titles = df_top_display["Title"].astype(str)
-            df_top_display["Title"] = np.where(titles.str.len() > 60, titles.str.slice(0, 57) + "...", titles)
-        
-        # Show clean dataframe with appropriate columns
-        df_top_display = df_top_display[display_columns]
+        st.subheader(f"Top {TOP_N} Markets by 24h Volume")
         
         # Apply formatting based on data source
-        if 'data_source' in df_top.columns and df_top['data_source'].iloc[0] == 'polymarket':
-            # Polymarket formatting - simpler
-            st.dataframe(
-                df_top_display.style.format({
-                    "Yes Bid": "${:,.3f}",
-                    "Yes Ask": "${:,.3f}",
-                    "Last Price": "${:,.3f}",
-                    "Volume (24h)": "${:,.0f}",
-                    "Total Volume": "${:,.0f}",
-                }),
-                use_container_width=True,
-                hide_index=True,
-            )
-        else:
-            # Kalshi formatting - full
-            st.dataframe(
-                df_top_display.style.format({
-                    "Yes Bid": "${:,.0f}",
-                    "Yes Ask": "${:,.0f}",
-                    "No Bid": "${:,.0f}",
-                    "No Ask": "${:,.0f}",
-                    "Last Price": "${:,.0f}",
-                    "Volume (24h)": "${:,.0f}",
-                    "Total Volume": "${:,.0f}",
-                }),
-                use_container_width=True,
-                hide_index=True,
-            )
+        st.dataframe(
+            _format_money_columns(df_top_display, MONEY_FMT[top_source]),
+            use_container_width=True,
+            hide_index=True,
+        )
         
         st.divider()
         
         # ── Summary Table (Top 10 by Total Volume) ─────────────────────────
         st.subheader("Top 10 Active Markets by Total Volume")
-        # Build summary directly from raw df, sort by Total Volume, show top 10
-        vol24_sum, total_vol_sum = get_volume_columns(df)
-        
-        # Build summary DataFrame based on data source
-        if 'data_source' in df.columns and df['data_source'].iloc[0] == 'polymarket':
-            # Polymarket summary - simpler structure
-            df_sum = pd.DataFrame({
-                "Series":        df.get("Series", pd.Series(index=df.index, dtype=object)),
-                "Title":         df.get(title_col),
-                "Ticker":        df.get(ticker_col),
-                "Outcomes":      df.get('outcomes', "N/A"),
-                "Yes Ask":       df.get(yes_ask_col),
-                "Last Price":    df.get(last_price_col),
-                "Volume (24h)":  vol24_sum,
-                "Total Volume":  total_vol_sum,
-                "Status":        df.get('status', 'Unknown'),
-            })
-            
-            # Select columns for Polymarket summary
-            summary_columns = ["Series", "Title", "Ticker", "Outcomes", "Yes Ask", "Last Price", "Volume (24h)", "Total Volume", "Status"]
-        else:
-            # Kalshi summary - full structure
-            df_sum = pd.DataFrame({
-                "Series":        df.get("Series", pd.Series(index=df.index, dtype=object)),
-                "Title":         df.get(title_col),
-                "Ticker":        df.get(ticker_col),
-                "Yes Subtitle":  df.get("yes_sub_title", ""),
-                "No Subtitle":   df.get("no_sub_title", ""),
-                "Yes Ask":       df.get(yes_ask_col),
-                "No Ask":        df.get(no_ask_col),
-                "Last Price":    df.get(last_price_col),
-                "Volume (24h)":  vol24_sum,
-                "Total Volume":  total_vol_sum,
-                "Close Time":    df.get(close_time_col),
-            })
-            
-            # Select columns for Kalshi summary
-            summary_columns = ["Series", "Title", "Ticker", "Yes Subtitle", "No Subtitle", "Yes Ask", "No Ask", "Last Price", "Volume (24h)", "Total Volume", "Close Time"]
-        
-        # Sort by Total Volume descending and show top 10
-        df_sum = df_sum.assign(_total_vol=df_sum["Total Volume"].fillna(0)).sort_values("_total_vol", ascending=False).head(10).drop(columns=["_total_vol"])
-        
-        # Add link icon column and truncate titles
-        df_sum_display = df_sum.copy()
-        if "Title" in df_sum_display.columns:
-            titles = df_sum_display["Title"].astype(str)
-            df_sum_display["Title"] = np.where(titles.str.len() > 60, titles.str.slice(0, 57) + "...", titles)
-        
-        df_sum_display.insert(0, "🔎", "click")
-        df_sum_display = df_sum_display[summary_columns]
         
         # Apply formatting based on data source
-        if 'data_source' in df.columns and df['data_source'].iloc[0] == 'polymarket':
-            # Polymarket formatting - simpler
-            st.dataframe(
-                df_sum_display.style.format({
-                    "Yes Ask": "${:,.3f}",
-                    "Last Price": "${:,.3f}",
-                    "Volume (24h)": "${:,.0f}",
-                    "Total Volume": "${:,.0f}",
-                }),
-                use_container_width=True,
-                hide_index=True,
-            )
-        else:
-            # Kalshi formatting - full
-            st.dataframe(
-                df_sum_display.style.format({
-                    "Yes Ask": "${:,.0f}",
-                    "No Ask": "${:,.0f}",
-                    "Last Price": "${:,.0f}",
-                    "Volume (24h)": "${:,.0f}",
-                    "Total Volume": "${:,.0f}",
-                }),
-                use_container_width=True,
-                hide_index=True,
-            )
+        st.dataframe(
+            _format_money_columns(df_sum_display, MONEY_FMT[sum_source]),
+            use_container_width=True,
+            hide_index=True,
+        )
         
         st.divider()
         
         # ── Search Markets ───────────────────────────────────────────────────
-        st.subheader("🔍 Search Markets")
-        
-        # Search by title
-        search_term = st.text_input("Search markets by title:", placeholder="Enter part of a market title...")
-        
-        if search_term:
-            # Filter markets by search term
-            filt = df[title_col].str.contains(search_term, case=False, na=False)
-            df_search = df.loc[filt]
-            
-            if not df_search.empty:
-                st.success(f"Found {len(df_search)} markets matching '{search_term}'")
-                
-                # Safely get volume data for search results
-                try:
-                    vol24_search = vol24_series.loc[df_search.index]
-                    total_vol_search = total_vol_series.loc[df_search.index]
-                except (KeyError, AttributeError):
-                    # Fallback if indices don't match
-                    vol24_search = pd.Series(0, index=df_search.index)
-                    total_vol_search = pd.Series(0, index=df_search.index)
-                
-                # Build display df based on data source
-                if 'data_source' in df_search.columns and df_search['data_source'].iloc[0] == 'polymarket':
-                    # Polymarket search display - simpler structure
-                    df_search_display = pd.DataFrame({
-                        "Series":        df_search.get("Series", pd.Series(index=df_search.index, dtype=object)),
-                        "Title":         df_search.get(title_col),
-                        "Ticker":        df_search.get(ticker_col),
-                        "Outcomes":      df_search.get('outcomes', "N/A"),
-                        "Yes Ask":       df_search.get(yes_ask_col),
-                        "Last Price":    df_search.get(last_price_col),
-                        "Volume (24h)":  vol24_search,
-                        "Total Volume":  total_vol_search,
-                    })
-                    
-                    # Select columns for Polymarket search
-                    search_columns = ["Series", "Title", "Ticker", "Outcomes", "Yes Ask", "Last Price", "Volume (24h)", "Total Volume"]
-                else:
-                    # Kalshi search display - full structure
-                    df_search_display = pd.DataFrame({
-                        "Series":        df_search.get("Series", pd.Series(index=df_search.index, dtype=object)),
-                        "Title":         df_search.get(title_col),
-                        "Ticker":        df_search.get(ticker_col),
-                        "Yes Ask":       df_search.get(yes_ask_col),
-                        "No Ask":        df_search.get(no_ask_col),
-                        "Last Price":    df_search.get(last_price_col),
-                        "Volume (24h)":  vol24_search,
-                        "Total Volume":  total_vol_search,
-                    })
-                    
-                    # Select columns for Kalshi search
-                    search_columns = ["Series", "Title", "Ticker", "Yes Ask", "No Ask", "Last Price", "Volume (24h)", "Total Volume"]
-                
-                # Truncate titles and add link icon column
-                if "Title" in df_search_display.columns:
-                    titles = df_search_display["Title"].astype(str)
-                    df_search_display["Title"] = np.where(titles.str.len() > 60, titles.str.slice(0, 57) + "...", titles)
-                
-                df_search_display.insert(0, "🔎", "click")
-                df_search_display = df_search_display[search_columns]
-                
-                # Apply formatting based on data source
-                if 'data_source' in df_search.columns and df_search['data_source'].iloc[0] == 'polymarket':
-                    # Polymarket formatting - simpler
-                    st.dataframe(
-                        df_search_display.style.format({
-                            "Yes Ask": "${:,.3f}",
-                            "Last Price": "${:,.3f}",
-                            "Volume (24h)": "${:,.0f}",
-                            "Total Volume": "${:,.0f}",
-                        }),
-                        use_container_width=True,
-                        hide_index=True,
-                    )
-                else:
-                    # Kalshi formatting - full
-                    st.dataframe(
-                        df_search_display.style.format({
-                            "Yes Ask": "${:,.0f}",
-                            "No Ask": "${:,.0f}",
-                            "Last Price": "${:,.0f}",
-                            "Volume (24h)": "${:,.0f}",
-                            "Total Volume": "${:,.0f}",
-                        }),
-                        use_container_width=True,
-                        hide_index=True,
-                    )
-            else:
-                st.warning(f"No markets found matching '{search_term}'")
+        _search_panel(df)
         
         # ── Explanation ─────────────────────────────────────────────────────
         with st.expander("ℹ️ About This Page", expanded=False):
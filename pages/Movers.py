@@ -4,27 +4,138 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # Import helper to fix path issues
 import import_helper
 
 from utils import (
-    load_active_markets_from_store,
+    load_active_markets_filtered,
     get_events_to_series_mapping,
     get_volume_columns,
+    top_k_rows,
     load_candles_from_store,
     API_KEY,
     make_ticker_clickable,
     make_title_clickable,
     ACTIVE_MARKETS_PQ,
+    CANDLES_DIR,
+    CANDLES_DATASET_DIR,
+    candles_partition_path,
+    get_duckdb_connection,
 )
 from kalshi_client import KalshiClient
-import duckdb
 import os
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
+# Columns the page reads from the active markets store
+MOVERS_COLUMNS = (
+    "ticker", "title", "data_source", "yes_bid", "last_price", "previous_yes_bid",
+    "volume", "volume_24h", "volume_total", "close_time", "expiration_time", "open_time",
+)
+
+# Numeric columns of the calculate_moves_optimized result
+MOVES_NUMERIC_COLS = (
+    "yes_bid", "yes_bid_24h_ago", "yes_bid_7d_ago", "notional_move_24h", "percent_move_24h",
+    "notional_move_7d", "percent_move_7d", "hours_to_close", "abs_notional_move_24h",
+    "volume_24h", "total_volume",
+)
+
+# Top movers table: source column → display label
+TOP_MOVERS_DISPLAY = {
+    "ticker": "Ticker",
+    "title": "Title",
+    "yes_bid": "Yes Bid",
+    "yes_bid_24h_ago": "Yes Bid (24h Ago)",
+    "notional_move_24h": "24h Notional Move",
+    "percent_move_24h": "24h % Move",
+    "volume_24h": "Volume (24h)",
+    "total_volume": "Total Volume",
+    "days_to_close": "Days to Close",
+}
+
+VOLUME_TABLE_ROWS = 200  # % Recent Volume table only shows the head, so partition instead of full sort
+
+def _numify(df: pd.DataFrame, cols) -> None:
+    """Coerce the given columns to numbers in place, skipping ones that already are numeric."""
+    for col in cols:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+# Compact, sleek table formatting (emitted once at the top of each run)
+TABLE_CSS = """
+<style>
+.stDataFrame table { border-collapse: collapse !important; }
+.stDataFrame th, .stDataFrame td {
+  border: 1px solid #ddd !important;
+  padding: 4px 6px !important;
+  white-space: nowrap !important;
+  font-size: 12px !important;
+  line-height: 1.2 !important;
+}
+.stDataFrame th { 
+  background-color: #f2f2f2 !important;
+  font-weight: bold !important;
+}
+.stDataFrame td {
+  vertical-align: top !important;
+}
+/* Ensure titles don't wrap to multiple lines */
+.stDataFrame td:nth-child(3) {
+  max-width: 300px !important;
+  overflow: hidden !important;
+  text-overflow: ellipsis !important;
+  white-space: nowrap !important;
+}
+</style>
+"""
+
+def _tight_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Plain numpy dtypes for st.dataframe: numeric columns (including nullable Int64/Float64)
+    become float64 and Rank int32, so the Arrow conversion skips the masked-array path.
+    """
+    num_cols = [c for c in df.columns if c != "Rank" and pd.api.types.is_numeric_dtype(df[c])]
+    df[num_cols] = df[num_cols].astype("float64")
+    if "Rank" in df.columns:
+        df["Rank"] = df["Rank"].astype("int32")
+    return df
+
+def _to_utc_naive(values: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of timestamps to naive UTC datetimes in one vectorized pass.
+    Handles ISO strings, datetimes, and epoch seconds/milliseconds (>= 10^12 → ms);
+    unparseable values become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        dt = pd.to_datetime(values, utc=True)
+        return dt.dt.tz_convert(None)
+    
+    # Epoch values (numbers or digit strings): detect ms vs s by magnitude
+    epoch = pd.to_numeric(values, errors="coerce")
+    is_epoch = epoch.notna()
+    dt = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns, UTC]")
+    if is_epoch.any():
+        seconds = np.where(epoch >= 10**12, epoch / 1000.0, epoch)
+        dt = dt.where(~is_epoch, pd.to_datetime(pd.Series(seconds, index=values.index), unit="s", utc=True))
+    if not is_epoch.all():
+        parsed = pd.to_datetime(values.where(~is_epoch), utc=True, errors="coerce", format="ISO8601")
+        dt = dt.where(is_epoch, parsed)
+    return dt.dt.tz_convert(None)
+
+def _hours_from_now(values: pd.Series) -> pd.Series:
+    """Hours from now (UTC) until each timestamp, clipped at 0; NaN where unparseable."""
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    return ((_to_utc_naive(values) - now).dt.total_seconds() / 3600.0).clip(lower=0)
+
+@st.cache_data(ttl=60, show_spinner=False)
 def check_parquet_data_freshness() -> tuple[bool, str]:
     """
     Check if Parquet data is fresh enough to use instead of live API calls.
-    Returns (is_fresh, reason) tuple.
+    Returns (is_fresh, reason) tuple; cached for a minute so widget reruns skip the stat.
     """
     try:
         # Check the actual parquet file timestamp instead of changelog
@@ -48,33 +159,52 @@ def check_parquet_data_freshness() -> tuple[bool, str]:
     except Exception as e:
         return False, f"Error checking freshness: {e}"
 
+LIVE_FETCH_WORKERS = 16       # Concurrent get_market requests on the stale-data path
+LIVE_FETCH_MAX_PER_SEC = 10   # Cap on request starts per second to stay clear of 429s
+
+@st.cache_resource
+def _get_kalshi_client() -> KalshiClient:
+    """One client (and connection pool) shared by every live fetch and worker thread."""
+    return KalshiClient(api_key=API_KEY)
+
 def get_live_market_data(tickers: list) -> pd.DataFrame:
     """
     Fetch live market data from Kalshi API to get current yes_bid prices.
     This fixes the stale data issue by getting real-time prices.
+    Requests run on a thread pool (rate-capped); rows keep the input ticker order.
     """
     try:
-        client = KalshiClient(api_key=API_KEY)
-        live_data = []
+        client = _get_kalshi_client()
+        
+        # Space request starts at least 1/LIVE_FETCH_MAX_PER_SEC apart across all workers
+        rate_lock = threading.Lock()
+        next_slot = [time.monotonic()]
+        
+        def fetch(ticker):
+            with rate_lock:
+                now = time.monotonic()
+                wait = next_slot[0] - now
+                next_slot[0] = max(now, next_slot[0]) + 1.0 / LIVE_FETCH_MAX_PER_SEC
+            if wait > 0:
+                time.sleep(wait)
+            return client.get_market(ticker)
         
         # Add progress bar for live data fetching
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # Fetch markets in batches to avoid overwhelming the API
-        batch_size = 50
-        for i in range(0, len(tickers), batch_size):
-            batch_tickers = tickers[i:i + batch_size]
-            
-            for ticker in batch_tickers:
+        rows = {}
+        update_every = max(1, len(tickers) // 50)
+        with ThreadPoolExecutor(max_workers=LIVE_FETCH_WORKERS) as executor:
+            futures = {executor.submit(fetch, ticker): ticker for ticker in tickers}
+            # Streamlit elements are only touched from this (main) thread
+            for done, future in enumerate(as_completed(futures), start=1):
+                ticker = futures[future]
                 try:
-                    status_text.text(f"Fetching live data for {ticker}... ({len(live_data)+1}/{len(tickers)})")
-                    
-                    # Get individual market data
-                    resp = client.get_market(ticker)
+                    resp = future.result()
                     if resp and "market" in resp:
                         market = resp["market"]
-                        live_data.append({
+                        rows[ticker] = {
                             "ticker": ticker,
                             "yes_bid": market.get("yes_bid"),
                             "yes_ask": market.get("yes_ask"),
@@ -83,246 +213,262 @@ def get_live_market_data(tickers: list) -> pd.DataFrame:
                             "open_interest": market.get("open_interest", 0),
                             "status": market.get("status"),
                             "close_time": market.get("close_time")
-                        })
-                    
-                    progress_bar.progress((len(live_data)) / len(tickers))
-                    
+                        }
                 except Exception as e:
                     st.warning(f"Could not fetch live data for {ticker}: {str(e)}")
-                    continue
+                
+                # Refresh the UI about 50 times in total rather than once per ticker
+                if done % update_every == 0 or done == len(tickers):
+                    status_text.text(f"Fetching live data for {ticker}... ({done}/{len(tickers)})")
+                    progress_bar.progress(done / len(tickers))
         
         progress_bar.empty()
         status_text.empty()
         
-        return pd.DataFrame(live_data)
+        return pd.DataFrame([rows[t] for t in tickers if t in rows])
     except Exception as e:
         st.error(f"Error fetching live market data: {str(e)}")
         return pd.DataFrame()
 
-def get_7d_ago_price_optimized(ticker: str, hours_to_close: float) -> float:
+# Nearest candle to each ticker's target_ts inside its window; ? is the list of candle files
+YES_BID_NEAR_SQL = r"""
+SELECT c.ticker, c.yes_bid
+FROM (
+    SELECT regexp_extract(filename, 'candles_([^/\\]+)_1h\.parquet$', 1) AS ticker,
+           yes_bid, end_period_ts
+    FROM read_parquet(?, filename=true)
+) c
+JOIN targets t USING (ticker)
+WHERE c.end_period_ts BETWEEN t.start_ts AND t.end_ts
+QUALIFY row_number() OVER (PARTITION BY c.ticker ORDER BY abs(c.end_period_ts - t.target_ts)) = 1
+"""
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _available_candle_tickers() -> frozenset:
+    """Tickers with an hourly candle file, from one directory listing (refreshed every 5 minutes)."""
+    prefix, suffix = "candles_", "_1h.parquet"
+    try:
+        names = os.listdir(CANDLES_DIR)
+    except OSError:
+        return frozenset()
+    return frozenset(
+        name[len(prefix):-len(suffix)] for name in names
+        if name.startswith(prefix) and name.endswith(suffix)
+    )
+
+def _candle_file_overlaps(path: str, start_ts: int, end_ts: int) -> bool:
     """
-    Optimized version: fetch minimal data needed for 7 days ago price using duckdb efficiently.
+    True if any row group's end_period_ts statistics overlap [start_ts, end_ts].
+    Reads only the Parquet footer; missing or unreadable files count as no overlap,
+    row groups without statistics count as overlapping.
     """
     try:
-        # Check if candle file exists
-        candle_path = os.path.join("data", "candles", f"candles_{ticker}_1h.parquet")
-        if not os.path.exists(candle_path):
-            return np.nan
-            
-        # If market closes soon, we don't need much historical data
-        if hours_to_close < 168:  # Market closes within 7 days
-            # Just fetch 2-3 hours around the 7d mark
-            now = datetime.now()
-            target_time = now - timedelta(days=7)
-            start_ts = int((target_time - timedelta(hours=1)).timestamp())
-            end_ts = int((target_time + timedelta(hours=1)).timestamp())
-        else:
-            # Market has time - fetch 24 hours around the 7d mark
-            now = datetime.now()
-            target_time = now - timedelta(days=7)
-            start_ts = int((target_time - timedelta(hours=12)).timestamp())
-            end_ts = int((target_time + timedelta(hours=12)).timestamp())
-        
-        # Use duckdb to efficiently query the parquet files
-        query = f"""
-        SELECT yes_bid, end_period_ts
-        FROM read_parquet('{candle_path}')
-        WHERE end_period_ts BETWEEN {start_ts} AND {end_ts}
-        ORDER BY ABS(end_period_ts - {int(target_time.timestamp())})
-        LIMIT 1
-        """
-        
-        result = duckdb.query(query).fetchone()
-        if result and result[0] is not None:
-            return float(result[0])
-        
-        return np.nan
-        
-    except Exception as e:
-        return np.nan
+        metadata = pq.ParquetFile(path).metadata
+    except Exception:
+        return False
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.path_in_schema != "end_period_ts":
+                continue
+            stats = column.statistics
+            if stats is None or not stats.has_min_max or (stats.min <= end_ts and stats.max >= start_ts):
+                return True
+    return False
 
-def get_24h_ago_price_optimized(ticker: str, hours_to_close: float) -> float:
+def _yes_bids_near(targets: pd.DataFrame) -> dict:
     """
-    Optimized version: fetch minimal data needed for 24h ago price using duckdb efficiently.
+    Look up, from the hourly candle store, the yes_bid closest to each ticker's
+    target_ts within [start_ts, end_ts].
+    targets has columns ticker, target_ts, start_ts, end_ts; returns {ticker: yes_bid}
+    (tickers with no candle file or no candle in their window are absent, non-numeric bids are NaN).
     """
+    if targets.empty:
+        return {}
+    
+    # Decide per ticker, as load_candles_from_store_batch does: tickers already written to
+    # the partitioned dataset read from it, the rest (not yet migrated or refreshed) keep
+    # using their per-ticker candle files
+    bids = {}
+    if os.path.isdir(CANDLES_DATASET_DIR):
+        partitioned = np.fromiter(
+            (os.path.exists(candles_partition_path(t)) for t in targets["ticker"]),
+            dtype=bool, count=len(targets),
+        )
+        if partitioned.any():
+            bids = _yes_bids_near_dataset(targets[partitioned])
+            targets = targets[~partitioned]
+            if targets.empty:
+                return bids
+    
+    bids.update(_yes_bids_near_files(targets))
+    return bids
+
+def _yes_bids_near_files(targets: pd.DataFrame) -> dict:
+    """_yes_bids_near over the per-ticker candles_<T>_1h.parquet files, in one DuckDB pass."""
+    # Only scan files whose row-group statistics can contain the window
+    available = _available_candle_tickers()
+    candle_files = []
+    for ticker, start_ts, end_ts in zip(targets["ticker"], targets["start_ts"], targets["end_ts"]):
+        if ticker not in available:
+            continue
+        path = os.path.join(CANDLES_DIR, f"candles_{ticker}_1h.parquet")
+        if _candle_file_overlaps(path, int(start_ts), int(end_ts)):
+            candle_files.append(path)
+    if not candle_files:
+        return {}
+    
     try:
-        # Check if candle file exists
-        candle_path = os.path.join("data", "candles", f"candles_{ticker}_1h.parquet")
-        if not os.path.exists(candle_path):
-            return np.nan
-            
-        # If market closes soon, we don't need much historical data
-        if hours_to_close < 24:  # Market closes within 24 hours
-            # Just fetch 1 hour around the 24h mark
-            now = datetime.now()
-            target_time = now - timedelta(hours=24)
-            start_ts = int((target_time - timedelta(minutes=30)).timestamp())
-            end_ts = int((target_time + timedelta(minutes=30)).timestamp())
-        else:
-            # Market has time - fetch 2 hours around the 24h mark
-            now = datetime.now()
-            target_time = now - timedelta(hours=24)
-            start_ts = int((target_time - timedelta(hours=1)).timestamp())
-            end_ts = int((target_time + timedelta(hours=1)).timestamp())
-        
-        # Use duckdb to efficiently query the parquet files
-        query = f"""
-        SELECT yes_bid, end_period_ts
-        FROM read_parquet('{candle_path}')
-        WHERE end_period_ts BETWEEN {start_ts} AND {end_ts}
-        ORDER BY ABS(end_period_ts - {int(target_time.timestamp())})
-        LIMIT 1
-        """
-        
-        result = duckdb.query(query).fetchone()
-        if result and result[0] is not None:
-            return float(result[0])
-        
-        return np.nan
-        
-    except Exception as e:
-        return np.nan
+        # Cursor on the shared cached connection: the statement text is constant, and the
+        # registered targets view stays local to this cursor
+        con = get_duckdb_connection()
+        if con is None:
+            return {}
+        cur = con.cursor()
+        try:
+            cur.register("targets", targets)
+            rows = cur.execute(YES_BID_NEAR_SQL, [candle_files]).fetchall()
+        finally:
+            cur.close()
+    except Exception:
+        return {}
+    
+    return _coerce_bids([row[0] for row in rows], [row[1] for row in rows])
+
+def _yes_bids_near_dataset(targets: pd.DataFrame) -> dict:
+    """
+    _yes_bids_near over the hive-partitioned candle dataset: one pyarrow scan with the
+    ticker and end_period_ts filters pushed down, then the nearest candle per ticker.
+    """
+    try:
+        dataset = ds.dataset(
+            CANDLES_DATASET_DIR,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("ticker", pa.string())]), flavor="hive"),
+        )
+        scan_filter = (
+            ds.field("ticker").isin(targets["ticker"].astype(str).tolist())
+            & (ds.field("end_period_ts") >= int(targets["start_ts"].min()))
+            & (ds.field("end_period_ts") <= int(targets["end_ts"].max()))
+        )
+        candles = dataset.to_table(columns=["ticker", "yes_bid", "end_period_ts"], filter=scan_filter).to_pandas()
+    except Exception:
+        return {}
+    if candles.empty:
+        return {}
+    
+    candles["ticker"] = candles["ticker"].astype(str)
+    candles = candles.merge(targets, on="ticker")
+    candles = candles[candles["end_period_ts"].between(candles["start_ts"], candles["end_ts"])]
+    distance = (candles["end_period_ts"] - candles["target_ts"]).abs()
+    nearest = candles.iloc[np.argsort(distance.to_numpy(), kind="stable")].drop_duplicates("ticker")
+    return _coerce_bids(nearest["ticker"].tolist(), nearest["yes_bid"].tolist())
+
+def _coerce_bids(tickers: list, bids: list) -> dict:
+    """{ticker: yes_bid}; non-numeric values (nulls, structs) coerce to NaN in one pass."""
+    prices = pd.to_numeric(pd.Series(bids, index=tickers, dtype=object), errors="coerce").astype(float)
+    return prices.to_dict()
+
+def _lookup_targets(df: pd.DataFrame, target_ts: int, half_window: np.ndarray) -> pd.DataFrame:
+    """Targets frame for _yes_bids_near, with all window bounds computed as int64 arrays."""
+    target = np.full(len(df), target_ts, dtype=np.int64)
+    half_window = np.asarray(half_window, dtype=np.int64)
+    return pd.DataFrame({
+        "ticker": df["ticker"].astype(str).to_numpy(),
+        "target_ts": target,
+        "start_ts": target - half_window,
+        "end_ts": target + half_window,
+    })
+
+def get_24h_ago_prices_optimized(df: pd.DataFrame) -> dict:
+    """
+    Batch version: yes_bid ~24h ago for every ticker in df (needs hours_to_close).
+    Markets closing within 24h search ±30 minutes around the mark, others ±1 hour.
+    """
+    target_ts = int((datetime.now() - timedelta(hours=24)).timestamp())
+    half_window = np.where(df["hours_to_close"].to_numpy(dtype=float) < 24, 30 * 60, 60 * 60)
+    return _yes_bids_near(_lookup_targets(df, target_ts, half_window))
+
+def get_7d_ago_prices_optimized(df: pd.DataFrame) -> dict:
+    """
+    Batch version: yes_bid ~7 days ago for tickers with at least 7 days to close.
+    Markets closing within 7 days would search ±1 hour, others ±12 hours.
+    """
+    eligible = df[df["hours_to_close"] >= 168]
+    target_ts = int((datetime.now() - timedelta(days=7)).timestamp())
+    half_window = np.where(eligible["hours_to_close"].to_numpy(dtype=float) < 168, 60 * 60, 12 * 60 * 60)
+    return _yes_bids_near(_lookup_targets(eligible, target_ts, half_window))
 
 def calculate_moves_optimized(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate 24h and 7d moves for all markets in the dataframe.
-    Uses optimized historical data fetching.
+    Uses optimized historical data fetching; the move arithmetic runs as column operations.
     """
     try:
-        # Parse close times and calculate hours to close
-        def parse_close_time(close_time):
-            try:
-                if pd.isna(close_time):
-                    return np.nan
-                if isinstance(close_time, str):
-                    # Parse ISO format string
-                    dt = pd.to_datetime(close_time)
-                else:
-                    dt = close_time
-                now = pd.Timestamp.now()
-                hours_to_close = (dt - now).total_seconds() / 3600
-                return max(0, hours_to_close)
-            except:
-                return np.nan
-        
         # Ensure hours_to_close is calculated (data should already be pre-filtered)
         df = df.copy()
         if "hours_to_close" not in df.columns:
-            df["hours_to_close"] = df["close_time"].apply(parse_close_time)
-        
-        # Get list of tickers for batch processing
-        tickers = df["ticker"].tolist()
-        
-        # Calculate moves for each market
-        moves_data = []
-        
-        # Add progress indicator (only if in Streamlit context)
-        try:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            in_streamlit = True
-        except:
-            progress_bar = None
-            status_text = None
-            in_streamlit = False
-        
-        for i, ticker in enumerate(tickers):
-            try:
-                if in_streamlit and status_text:
-                    status_text.text(f"Calculating moves for {ticker}... ({i+1}/{len(tickers)})")
-                
-                # Get current values for this ticker
-                row_now = df[df["ticker"] == ticker].iloc[0]
-                current_yes_bid = row_now.get("yes_bid")
-                if pd.isna(current_yes_bid) or current_yes_bid == 0:
-                    current_yes_bid = row_now.get("last_price")
-                # If still missing, skip this ticker
-                if pd.isna(current_yes_bid) or current_yes_bid == 0:
-                    continue
-                
-                # Get hours to close for this market
-                hours_to_close = df[df["ticker"] == ticker]["hours_to_close"].iloc[0]
-                
-                # Get 24h ago price
-                yes_bid_24h_ago = get_24h_ago_price_optimized(ticker, hours_to_close)
-                if pd.isna(yes_bid_24h_ago):
-                    # Fallback: use previous_yes_bid from market data, or assume 0 move
-                    previous_bid = row_now.get("previous_yes_bid", 0)
-                    if pd.notna(previous_bid) and previous_bid > 0:
-                        yes_bid_24h_ago = previous_bid
-                    else:
-                        # Assume 0 move if no historical data found
-                        yes_bid_24h_ago = current_yes_bid
-                
-                # Get 7d ago price (only if market has enough time)
-                yes_bid_7d_ago = None
-                if hours_to_close >= 168:  # At least 7 days to close
-                    yes_bid_7d_ago = get_7d_ago_price_optimized(ticker, hours_to_close)
-                
-                # Calculate moves
-                if pd.notna(yes_bid_24h_ago) and yes_bid_24h_ago > 0:
-                    notional_move_24h = current_yes_bid - yes_bid_24h_ago
-                    percent_move_24h = (notional_move_24h / yes_bid_24h_ago) * 100
-                else:
-                    # If we can't get historical data, use a simple fallback
-                    # Show as 0 move rather than excluding the market entirely
-                    notional_move_24h = 0
-                    percent_move_24h = 0
-                
-                if pd.notna(yes_bid_7d_ago) and yes_bid_7d_ago > 0:
-                    notional_move_7d = current_yes_bid - yes_bid_7d_ago
-                    percent_move_7d = (notional_move_7d / yes_bid_7d_ago) * 100
-                else:
-                    # No 7d data available - show as N/A
-                    notional_move_7d = np.nan
-                    percent_move_7d = np.nan
-                
-                # Determine volume fields for display
-                vol_24h_val = row_now.get("volume_24h") if "volume_24h" in row_now.index else None
-                if pd.isna(vol_24h_val) or vol_24h_val is None:
-                    vol_24h_val = row_now.get("volume")
-                total_vol_val = row_now.get("volume")
-
-                # Store the data
-                moves_data.append({
-                    "ticker": ticker,
-                    "title": df[df["ticker"] == ticker]["title"].iloc[0],
-                    "yes_bid": current_yes_bid,
-                    "yes_bid_24h_ago": yes_bid_24h_ago,
-                    "yes_bid_7d_ago": yes_bid_7d_ago,
-                    "notional_move_24h": notional_move_24h,
-                    "percent_move_24h": percent_move_24h,
-                    "notional_move_7d": notional_move_7d,
-                    "percent_move_7d": percent_move_7d,
-                    "hours_to_close": hours_to_close,
-                    "abs_notional_move_24h": abs(notional_move_24h) if pd.notna(notional_move_24h) else 0,
-                    "volume_24h": vol_24h_val,
-                    "total_volume": total_vol_val,
-                })
-                
-                if in_streamlit and progress_bar:
-                    progress_bar.progress((i + 1) / len(tickers))
-                
-            except Exception as e:
-                if in_streamlit:
-                    st.warning(f"Error calculating moves for {ticker}: {str(e)}")
-                else:
-                    print(f"Warning: Error calculating moves for {ticker}: {str(e)}")
-                continue
-        
-        # Clear progress indicators (only if in Streamlit context)
-        if in_streamlit and progress_bar:
-            progress_bar.empty()
-        if in_streamlit and status_text:
-            status_text.empty()
-        
-        if not moves_data:
+            df["hours_to_close"] = _hours_from_now(df["close_time"])
+        
+        def numeric(col, default=np.nan):
+            if col in df.columns:
+                return pd.to_numeric(df[col], errors="coerce")
+            return pd.Series(default, index=df.index, dtype=float)
+        
+        # Current price: yes_bid, falling back to last_price; skip markets with neither
+        current_yes_bid = numeric("yes_bid")
+        current_yes_bid = current_yes_bid.mask(current_yes_bid.isna() | (current_yes_bid == 0), numeric("last_price"))
+        has_price = current_yes_bid.notna() & (current_yes_bid != 0)
+        df = df[has_price]
+        current_yes_bid = current_yes_bid[has_price]
+        if df.empty:
             return pd.DataFrame()
         
-        # Convert to DataFrame and sort by absolute notional move
-        moves_df = pd.DataFrame(moves_data)
-        moves_df = moves_df.sort_values("abs_notional_move_24h", ascending=False)
-        
+        # Historical prices for every ticker in two batch queries
+        prices_24h_ago = get_24h_ago_prices_optimized(df)
+        prices_7d_ago = get_7d_ago_prices_optimized(df)
+        hours_to_close = pd.to_numeric(df["hours_to_close"], errors="coerce")
+        
+        # 24h ago price; fallback: previous_yes_bid from market data, or assume 0 move
+        yes_bid_24h_ago = pd.to_numeric(df["ticker"].map(prices_24h_ago), errors="coerce")
+        previous_bid = numeric("previous_yes_bid", 0)
+        fallback_24h = previous_bid.where(previous_bid > 0, current_yes_bid)
+        yes_bid_24h_ago = yes_bid_24h_ago.fillna(fallback_24h)
+        
+        # 7d ago price only for markets with at least 7 days to close
+        yes_bid_7d_ago = pd.to_numeric(df["ticker"].map(prices_7d_ago), errors="coerce")
+        yes_bid_7d_ago = yes_bid_7d_ago.mask(~(hours_to_close >= 168))
+        
+        # Calculate moves: 24h shows 0 without a usable base, 7d shows N/A
+        has_24h = yes_bid_24h_ago > 0
+        notional_move_24h = (current_yes_bid - yes_bid_24h_ago).where(has_24h, 0.0)
+        percent_move_24h = (notional_move_24h / yes_bid_24h_ago * 100).where(has_24h, 0.0)
+        has_7d = yes_bid_7d_ago > 0
+        notional_move_7d = (current_yes_bid - yes_bid_7d_ago).where(has_7d)
+        percent_move_7d = (notional_move_7d / yes_bid_7d_ago * 100).where(has_7d)
+        
+        # Determine volume fields for display
+        total_volume = numeric("volume")
+        volume_24h = numeric("volume_24h").fillna(total_volume)
+        
+        moves_df = pd.DataFrame({
+            "ticker": df["ticker"],
+            "title": df["title"],
+            "yes_bid": current_yes_bid,
+            "yes_bid_24h_ago": yes_bid_24h_ago,
+            "yes_bid_7d_ago": yes_bid_7d_ago,
+            "notional_move_24h": notional_move_24h,
+            "percent_move_24h": percent_move_24h,
+            "notional_move_7d": notional_move_7d,
+            "percent_move_7d": percent_move_7d,
+            "hours_to_close": hours_to_close,
+            "abs_notional_move_24h": notional_move_24h.abs(),
+            "volume_24h": volume_24h,
+            "total_volume": total_volume,
+        }).reset_index(drop=True)
+        
+        # Left unsorted: main() selects the top movers with top_k_rows
         return moves_df
         
     except Exception as e:
@@ -334,39 +480,10 @@ def filter_by_time_to_close(df: pd.DataFrame, min_hours_to_close: int) -> pd.Dat
     Filter markets by minimum time to close.
     """
     try:
-        def parse_close_time(close_time):
-            """Robustly parse Kalshi close_time values to hours from now.
-            Handles ISO strings, pandas Timestamps, and epoch seconds/milliseconds.
-            """
-            try:
-                if pd.isna(close_time):
-                    return np.nan
-                # Epoch seconds/milliseconds
-                if isinstance(close_time, (int, float)) or (isinstance(close_time, str) and close_time.isdigit()):
-                    ts = int(float(close_time))
-                    # Detect ms vs s by magnitude (>= 10^12 → ms)
-                    if ts >= 10**12:
-                        dt = pd.to_datetime(ts, unit="ms", utc=True).tz_convert(None)
-                    else:
-                        dt = pd.to_datetime(ts, unit="s", utc=True).tz_convert(None)
-                # String timestamp (ISO)
-                elif isinstance(close_time, str):
-                    dt = pd.to_datetime(close_time, utc=True, errors="coerce")
-                    if pd.isna(dt):
-                        return np.nan
-                    dt = dt.tz_convert(None)
-                # Already datetime-like
-                else:
-                    dt = pd.to_datetime(close_time, utc=True).tz_convert(None)
-                now = pd.Timestamp.utcnow().tz_localize(None)
-                hours_to_close = (dt - now).total_seconds() / 3600.0
-                return max(0.0, hours_to_close)
-            except Exception:
-                return np.nan
-        
-        df = df.copy()
-        df["hours_to_close"] = df.get("close_time", pd.Series(np.nan, index=df.index)).apply(parse_close_time)
-        return df[df["hours_to_close"] >= min_hours_to_close]
+        # Filter first, then add the column to the (smaller) result instead of copying df
+        hours = _hours_from_now(df.get("close_time", pd.Series(np.nan, index=df.index)))
+        keep = hours >= min_hours_to_close
+        return df.loc[keep].assign(hours_to_close=hours[keep])
         
     except Exception as e:
         st.error(f"Error filtering by time to close: {str(e)}")
@@ -378,43 +495,57 @@ def filter_by_expiration_time(df: pd.DataFrame, min_hours_to_expiration: int) ->
     This is more accurate than close_time for filtering out sports games.
     """
     try:
-        def parse_expiration_time(expiration_time):
-            """Parse expiration_time to hours from now - similar to close_time parsing"""
-            try:
-                if pd.isna(expiration_time):
-                    return np.nan
-                # Handle different timestamp formats like in parse_close_time
-                if isinstance(expiration_time, (int, float)) or (isinstance(expiration_time, str) and expiration_time.isdigit()):
-                    ts = int(float(expiration_time))
-                    if ts >= 10**12:
-                        dt = pd.to_datetime(ts, unit="ms", utc=True).tz_convert(None)
-                    else:
-                        dt = pd.to_datetime(ts, unit="s", utc=True).tz_convert(None)
-                elif isinstance(expiration_time, str):
-                    dt = pd.to_datetime(expiration_time, utc=True, errors="coerce")
-                    if pd.isna(dt):
-                        return np.nan
-                    dt = dt.tz_convert(None)
-                else:
-                    dt = pd.to_datetime(expiration_time, utc=True).tz_convert(None)
-                
-                now = pd.Timestamp.utcnow().tz_localize(None)
-                hours_to_expiration = (dt - now).total_seconds() / 3600.0
-                return max(0.0, hours_to_expiration)
-            except Exception:
-                return np.nan
-        
-        df = df.copy()
-        df["hours_to_expiration"] = df.get("expiration_time", pd.Series(np.nan, index=df.index)).apply(parse_expiration_time)
-        return df[df["hours_to_expiration"] >= min_hours_to_expiration]
+        # Filter first, then add the column to the (smaller) result instead of copying df
+        hours = _hours_from_now(df.get("expiration_time", pd.Series(np.nan, index=df.index)))
+        keep = hours >= min_hours_to_expiration
+        return df.loc[keep].assign(hours_to_expiration=hours[keep])
         
     except Exception as e:
         st.error(f"Error filtering by expiration time: {str(e)}")
         return df
 
+def _apply_filters(df: pd.DataFrame, min_volume: float, min_days_to_expiration: float,
+                   min_days_to_close: float, max_days_to_close: float,
+                   min_days_since_open: float) -> pd.DataFrame:
+    """
+    Apply the page's volume, expiration, close-time and days-since-open filters in order.
+    Shows a warning naming the first filter that leaves no markets and returns an empty frame.
+    """
+    # Filter by volume requirement using the actual 24h volume data
+    vol24_series, _ = get_volume_columns(df)
+    df = df[vol24_series >= min_volume]
+    if df.empty:
+        st.warning(f"No markets meet the volume requirement (≥${min_volume:,}).")
+        return df
+    
+    # Filter by days to expiration (this solves the sports game issue!)
+    df = filter_by_expiration_time(df, int(min_days_to_expiration * 24))
+    if df.empty:
+        st.warning(f"No markets meet the expiration time requirement (≥{min_days_to_expiration:.1f} days to expiration).")
+        return df
+    
+    # Filter by days to close using separate min/max filters
+    df = filter_by_time_to_close(df, int(min_days_to_close * 24))
+    if "hours_to_close" not in df.columns:
+        df = df.assign(hours_to_close=_hours_from_now(df["close_time"]))
+    df = df[df["hours_to_close"] <= int(max_days_to_close * 24)]
+    if df.empty:
+        st.warning(f"No markets meet the days to close requirement ({min_days_to_close:.1f}-{max_days_to_close:.1f} days).")
+        return df
+    
+    # Filter by days since open
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    days_since_open = ((now - _to_utc_naive(df["open_time"])).dt.total_seconds() / 86400.0).clip(lower=0)
+    keep = days_since_open >= min_days_since_open
+    df = df.loc[keep].assign(days_since_open=days_since_open[keep])
+    if df.empty:
+        st.warning(f"No markets meet the days since open requirement (≥{min_days_since_open:.1f} days).")
+    return df
+
 def main():
     # Page title and description (no set_page_config needed for pages)
     st.title("Market Movers")
+    st.markdown(TABLE_CSS, unsafe_allow_html=True)
     st.markdown("Track the biggest 24-hour price movers by notional value")
     
     st.markdown("""
@@ -491,80 +622,20 @@ def main():
         is_fresh, freshness_reason = check_parquet_data_freshness()
         
         if is_fresh:
-
-            # Load active markets from cache (fresh data)
-            markets_df = load_active_markets_from_store()
+            # Load active markets from cache (fresh data); volume and close-time
+            # bounds are pushed into the Parquet scan
+            markets_df = load_active_markets_filtered(
+                min_volume, min_days_to_close * 24, max_days_to_close * 24, MOVERS_COLUMNS
+            )
             
             if markets_df.empty:
                 st.error("Could not load markets data. Please check your API connection.")
                 return
             
-            # Get volume columns for proper filtering
-            vol24_series, total_vol_series = get_volume_columns(markets_df)
-            
-            # Filter by volume requirement using the actual 24h volume data
-            volume_filter = vol24_series >= min_volume
-            markets_df = markets_df[volume_filter]
-            
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the volume requirement (≥${min_volume:,}).")
-                return
-            
-            # Filter by days to expiration (NEW - this solves the sports game issue!)
-            min_hours_to_expiration = int(min_days_to_expiration * 24)
-            markets_df = filter_by_expiration_time(markets_df, min_hours_to_expiration)
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the expiration time requirement (≥{min_days_to_expiration:.1f} days to expiration).")
-                return
-            
-            # Filter by days to close using separate min/max filters
-            min_hours_to_close = int(min_days_to_close * 24)
-            max_hours_to_close = int(max_days_to_close * 24)
-            
-            # Apply min days to close filtering
-            markets_df = filter_by_time_to_close(markets_df, min_hours_to_close)
-            
-            # Add max days filtering
-            def parse_close_time_for_max(close_time):
-                try:
-                    if pd.isna(close_time):
-                        return np.nan
-                    dt = pd.to_datetime(close_time, utc=True).tz_convert(None)
-                    now = pd.Timestamp.now()
-                    hours_to_close = (dt - now).total_seconds() / 3600
-                    return max(0, hours_to_close)
-                except:
-                    return np.nan
-            
-            if "hours_to_close" not in markets_df.columns:
-                markets_df["hours_to_close"] = markets_df["close_time"].apply(parse_close_time_for_max)
-            
-            # Filter by max days as well
-            markets_df = markets_df[markets_df["hours_to_close"] <= max_hours_to_close]
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the days to close requirement ({min_days_to_close:.1f}-{max_days_to_close:.1f} days).")
-                return
-            
-            # Filter by days since open
-            def parse_open_time_for_days_since(open_time):
-                try:
-                    if pd.isna(open_time):
-                        return np.nan
-                    dt = pd.to_datetime(open_time, utc=True).tz_convert(None)
-                    now = pd.Timestamp.now()
-                    hours_since_open = (now - dt).total_seconds() / 3600
-                    return max(0, hours_since_open / 24)  # Convert to days
-                except:
-                    return np.nan
-            
-            markets_df["days_since_open"] = markets_df["open_time"].apply(parse_open_time_for_days_since)
-            markets_df = markets_df[markets_df["days_since_open"] >= min_days_since_open]
-            
+            # Volume, expiration, close-time and days-since-open filters
+            markets_df = _apply_filters(markets_df, min_volume, min_days_to_expiration,
+                                        min_days_to_close, max_days_to_close, min_days_since_open)
             if markets_df.empty:
-                st.warning(f"No markets meet the days since open requirement (≥{min_days_since_open:.1f} days).")
                 return
             
             # Use Parquet data directly - no need for live API calls
@@ -574,79 +645,19 @@ def main():
             st.info("🔄 Fetching live market data from Kalshi API...")
             
             # Load active markets from cache first (for initial filtering)
-            markets_df = load_active_markets_from_store()
+            markets_df = load_active_markets_filtered(
+                min_volume, min_days_to_close * 24, max_days_to_close * 24, MOVERS_COLUMNS
+            )
             st.caption(f"Loaded {len(markets_df)} rows from active markets parquet (stale mode)")
             
             if markets_df.empty:
                 st.error("Could not load markets data. Please check your API connection.")
                 return
             
-            # Get volume columns for proper filtering
-            vol24_series, total_vol_series = get_volume_columns(markets_df)
-            
-            # Filter by volume requirement using the actual 24h volume data
-            volume_filter = vol24_series >= min_volume
-            markets_df = markets_df[volume_filter]
-            
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the volume requirement (≥${min_volume:,}).")
-                return
-            
-            # Filter by days to expiration (same logic as fresh data path)
-            min_hours_to_expiration = int(min_days_to_expiration * 24)
-            markets_df = filter_by_expiration_time(markets_df, min_hours_to_expiration)
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the expiration time requirement (≥{min_days_to_expiration:.1f} days to expiration).")
-                return
-            
-            # Filter by days to close using separate min/max filters (same logic as fresh data path)
-            min_hours_to_close = int(min_days_to_close * 24)
-            max_hours_to_close = int(max_days_to_close * 24)
-            
-            # Apply min days to close filtering
-            markets_df = filter_by_time_to_close(markets_df, min_hours_to_close)
-            
-            # Add max days filtering
-            def parse_close_time_for_max_stale(close_time):
-                try:
-                    if pd.isna(close_time):
-                        return np.nan
-                    dt = pd.to_datetime(close_time, utc=True).tz_convert(None)
-                    now = pd.Timestamp.now()
-                    hours_to_close = (dt - now).total_seconds() / 3600
-                    return max(0, hours_to_close)
-                except:
-                    return np.nan
-            
-            if "hours_to_close" not in markets_df.columns:
-                markets_df["hours_to_close"] = markets_df["close_time"].apply(parse_close_time_for_max_stale)
-            
-            # Filter by max days as well
-            markets_df = markets_df[markets_df["hours_to_close"] <= max_hours_to_close]
-            
+            # Same filters as the fresh data path
+            markets_df = _apply_filters(markets_df, min_volume, min_days_to_expiration,
+                                        min_days_to_close, max_days_to_close, min_days_since_open)
             if markets_df.empty:
-                st.warning(f"No markets meet the days to close requirement ({min_days_to_close:.1f}-{max_days_to_close:.1f} days).")
-                return
-            
-            # Filter by days since open
-            def parse_open_time_for_days_since_stale(open_time):
-                try:
-                    if pd.isna(open_time):
-                        return np.nan
-                    dt = pd.to_datetime(open_time, utc=True).tz_convert(None)
-                    now = pd.Timestamp.now()
-                    hours_since_open = (now - dt).total_seconds() / 3600
-                    return max(0, hours_since_open / 24)  # Convert to days
-                except:
-                    return np.nan
-            
-            markets_df["days_since_open"] = markets_df["open_time"].apply(parse_open_time_for_days_since_stale)
-            markets_df = markets_df[markets_df["days_since_open"] >= min_days_since_open]
-            
-            if markets_df.empty:
-                st.warning(f"No markets meet the days since open requirement (≥{min_days_since_open:.1f} days).")
                 return
             
             # Get list of tickers for live data fetch
@@ -680,74 +691,22 @@ def main():
             st.warning("No markets have sufficient data for move calculations.")
             return
     
+    # Coerce any object-typed numeric columns once, for both tables below
+    _numify(moves_df, MOVES_NUMERIC_COLS)
+    # shared by both tables below, so derive it once
+    moves_df["days_to_close"] = moves_df["hours_to_close"] / 24
+    
     # ── Display Results ────────────────────────────────────────────────────
     st.subheader(f"📊 Top Movers by Notional Move (showing {min(len(moves_df), max_rows)} of {len(moves_df)} markets)")
     
     # Sort by absolute notional move (largest moves first) - this is the key requirement
-    top_movers = moves_df.nlargest(max_rows, "abs_notional_move_24h")
-    
-    # Get volume columns for display
-    vol24_series, total_vol_series = get_volume_columns(top_movers)
-    
-    # FIXED: Ensure all columns are properly typed and handle missing data
-    # Add proper +/- indicators for moves
-    def format_move_with_sign(value, prefix="$"):
-        if pd.isna(value):
-            return "N/A"
-        sign = "+" if value > 0 else ""
-        return f"{sign}{prefix}{value:,.0f}"
-    
-    def format_percent_with_sign(value):
-        if pd.isna(value):
-            return "N/A"
-        sign = "+" if value > 0 else ""
-        return f"{sign}{value:.1f}%"
-    
-    # ── Inject inline CSS for compact, sleek table formatting ───────────────
-    st.markdown(
-        """
-        <style>
-        .stDataFrame table { border-collapse: collapse !important; }
-        .stDataFrame th, .stDataFrame td {
-          border: 1px solid #ddd !important;
-          padding: 4px 6px !important;
-          white-space: nowrap !important;
-          font-size: 12px !important;
-          line-height: 1.2 !important;
-        }
-        .stDataFrame th { 
-          background-color: #f2f2f2 !important;
-          font-weight: bold !important;
-        }
-        .stDataFrame td {
-          vertical-align: top !important;
-        }
-        /* Ensure titles don't wrap to multiple lines */
-        .stDataFrame td:nth-child(3) {
-          max-width: 300px !important;
-          overflow: hidden !important;
-          text-overflow: ellipsis !important;
-          white-space: nowrap !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    top_movers = top_k_rows(moves_df, moves_df["abs_notional_move_24h"], int(max_rows))
     
     # Build one consolidated dataframe for display instead of manual row rendering
-    display_df = pd.DataFrame({
-        "Rank": range(1, len(top_movers) + 1),
-        "Ticker": top_movers["ticker"].astype(str),
-        "Title": top_movers["title"].astype(str),
-        "Yes Bid": pd.to_numeric(top_movers["yes_bid"], errors="coerce"),
-        "Yes Bid (24h Ago)": pd.to_numeric(top_movers["yes_bid_24h_ago"], errors="coerce"),
-        "24h Notional Move": pd.to_numeric(top_movers["notional_move_24h"], errors="coerce"),
-        "24h % Move": pd.to_numeric(top_movers["percent_move_24h"], errors="coerce"),
-
-        "Volume (24h)": pd.to_numeric(top_movers["volume_24h"], errors="coerce"),
-        "Total Volume": pd.to_numeric(top_movers["total_volume"], errors="coerce"),
-        "Days to Close": pd.to_numeric(top_movers["hours_to_close"], errors="coerce") / 24,
-    })
+    # (columns are already numeric, so this is a projection + relabel)
+    display_df = top_movers[list(TOP_MOVERS_DISPLAY)].rename(columns=TOP_MOVERS_DISPLAY).reset_index(drop=True)
+    display_df.insert(0, "Rank", np.arange(1, len(display_df) + 1, dtype=np.int32))
+    display_df = _tight_dtypes(display_df)
     
     # Format and display the dataframe
     st.dataframe(
@@ -757,8 +716,9 @@ def main():
         column_config={
             "Yes Bid": st.column_config.NumberColumn("Yes Bid", format="$%.0f"),
             "Yes Bid (24h Ago)": st.column_config.NumberColumn("Yes Bid (24h Ago)", format="$%.0f"),
-            "24h Notional Move": st.column_config.NumberColumn("24h Notional Move", format="$%.0f"),
-            "24h % Move": st.column_config.NumberColumn("24h % Move", format="%.1f%%"),
+            # Signed printf formats render the +/- indicators client-side, keeping the columns numeric
+            "24h Notional Move": st.column_config.NumberColumn("24h Notional Move", format="$%+.0f"),
+            "24h % Move": st.column_config.NumberColumn("24h % Move", format="%+.1f%%"),
 
             "Volume (24h)": st.column_config.NumberColumn("Volume (24h)", format="$%.0f"),
             "Total Volume": st.column_config.NumberColumn("Total Volume", format="$%.0f"),
@@ -773,27 +733,29 @@ def main():
     
     # Calculate % recent volume for all markets that meet the filters
     if not moves_df.empty:
-        # Fix total volume calculation - ensure we're using the correct column mapping
-        # moves_df should have volume_24h and total_volume from the calculation
-        vol_24h = pd.to_numeric(moves_df.get("volume_24h", 0), errors="coerce").fillna(0)
-        total_volume = pd.to_numeric(moves_df.get("total_volume", 0), errors="coerce").fillna(0)
+        # moves_df has numeric volume_24h and total_volume from the calculation
+        vol_24h = moves_df["volume_24h"].fillna(0).to_numpy(dtype=np.float64, copy=False)
+        total_volume = moves_df["total_volume"].fillna(0).to_numpy(dtype=np.float64, copy=False)
         
-        # Calculate % recent volume (24h / total)
-        percent_recent_volume = np.where(total_volume > 0, (vol_24h / total_volume) * 100, 0)
+        # Calculate % recent volume (24h / total); zero-total rows stay 0 without dividing
+        percent_recent_volume = np.divide(
+            vol_24h, total_volume, out=np.zeros_like(vol_24h), where=total_volume > 0
+        )
+        percent_recent_volume *= 100
         
         # Create dataframe for % recent volume table
         volume_df = pd.DataFrame({
-            "Ticker": moves_df["ticker"].astype(str),
-            "Title": moves_df["title"].astype(str),
+            "Ticker": moves_df["ticker"].to_numpy(),
+            "Title": moves_df["title"].to_numpy(),
             "24h Volume": vol_24h,
             "Total Volume": total_volume,
             "% Recent Volume": percent_recent_volume,
-            "Yes Bid": pd.to_numeric(moves_df["yes_bid"], errors="coerce").fillna(0),
-            "Days to Close": pd.to_numeric(moves_df.get("hours_to_close", 0), errors="coerce").fillna(0) / 24
+            "Yes Bid": moves_df["yes_bid"].fillna(0).to_numpy(dtype=np.float64, copy=False),
+            "Days to Close": moves_df["days_to_close"].fillna(0).to_numpy(dtype=np.float64, copy=False)
         })
         
-        # Sort by % recent volume descending
-        volume_df = volume_df.sort_values("% Recent Volume", ascending=False)
+        # Top rows by % recent volume, descending
+        volume_df = _tight_dtypes(top_k_rows(volume_df, volume_df["% Recent Volume"], VOLUME_TABLE_ROWS))
         
         # Display as proper dataframe
         st.dataframe(
@@ -3,6 +3,7 @@
 import streamlit as st
 import pandas as pd
 import datetime
+import json
 import altair as alt
 from requests.exceptions import HTTPError
 import numpy as np
@@ -18,7 +19,8 @@ try:
         get_client, 
         get_unified_markets, 
         get_markets_by_source, 
-        load_candles_from_store
+        load_candles_from_store,
+        lttb_indices
     )
     UTILS_AVAILABLE = True
 except ImportError as e:
@@ -34,6 +36,8 @@ except ImportError as e:
         return pd.DataFrame()
     def load_candles_from_store(ticker, granularity, start_ts, end_ts):
         return pd.DataFrame()
+    def lttb_indices(x, y, n_out):
+        return np.linspace(0, len(x) - 1, min(n_out, len(x))).astype(np.int64)
 
 try:
     from shared_sidebar import render_shared_sidebar, get_selected_data_sources, get_selected_data_source_display
@@ -50,6 +54,51 @@ except ImportError as e:
     def get_selected_data_source_display():
         return "Kalshi (default)"
 
+# Optional JIT for the daily OHLCV/VWAP rollup on long minute ranges
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+NUMBA_MIN_ROWS = 50_000  # below this the pandas groupby is already fast enough
+
+# Clickable ticker styling for link-style buttons
+CLICKABLE_TICKER_CSS = """
+<style>
+.stButton > button {
+    background: transparent;
+    color: #0066cc;
+    border: none;
+    text-decoration: underline;
+    font-weight: 500;
+    padding: 0;
+    margin: 0;
+    cursor: pointer;
+    text-align: left;
+    box-shadow: none;
+}
+.stButton > button:hover {
+    background: transparent;
+    color: #004499;
+    text-decoration: underline;
+}
+</style>
+"""
+
+MAX_CHART_POINTS = 5000  # Rows embedded in the chart spec; finer data is thinned before plotting
+
+PRICE_KEYS = ("open", "high", "low", "close", "mean")
+
+def _flatten_price(prices: pd.Series) -> np.ndarray:
+    """(N, 5) float array of the open/high/low/close/mean price fields; missing values are NaN."""
+    out = np.full((len(prices), len(PRICE_KEYS)), np.nan)
+    values = prices.to_numpy()
+    for j, key in enumerate(PRICE_KEYS):
+        out[:, j] = np.array([p.get(key) if isinstance(p, dict) else None for p in values], dtype=float)
+    return out
+
 def create_line_chart(df: pd.DataFrame, title: str) -> alt.Chart:
     """
     Create a line chart showing price evolution over time.
@@ -58,44 +107,49 @@ def create_line_chart(df: pd.DataFrame, title: str) -> alt.Chart:
         return alt.Chart().mark_text().encode(text=alt.value("No data available"))
     
     # Convert timestamp to datetime
-    df_chart = df.copy()
+    df_chart = df[["end_period_ts", "close_price", "volume"]].copy()
     df_chart["timestamp"] = pd.to_datetime(df_chart["end_period_ts"], unit="s")
     
     # Make lines continuous by filling gaps with forward fill
     if not df_chart.empty:
-        # Get the full timestamp range
-        min_time = df_chart["timestamp"].min()
-        max_time = df_chart["timestamp"].max()
-        
-        # Create complete timestamp range (use the same frequency as the data)
         # Determine frequency from the data
         if len(df_chart) > 1:
-            time_diff = df_chart["timestamp"].iloc[1] - df_chart["timestamp"].iloc[0]
+            time_diff = df_chart["timestamp"].iat[1] - df_chart["timestamp"].iat[0]
             if time_diff.total_seconds() <= 60:  # 1 minute or less
                 freq = "1min"
             elif time_diff.total_seconds() <= 3600:  # 1 hour or less
-                freq = "1H"
+                freq = "1h"
             else:
                 freq = "1D"
         else:
-            freq = "1H"  # Default to hourly
-        
-        full_timestamps = pd.date_range(start=min_time, end=max_time, freq=freq)
-        
-        # Create complete timestamp series
-        complete_timestamps = pd.DataFrame({"timestamp": full_timestamps})
+            freq = "1h"  # Default to hourly
         
-        # Merge with actual data and forward fill
-        merged = complete_timestamps.merge(df_chart, on="timestamp", how="left")
-        merged = merged.sort_values("timestamp").fillna(method="ffill")
-        
-        # Only keep rows where we have actual data or forward-filled data
-        merged = merged.dropna(subset=["close_price"])
-        
-        df_chart = merged
+        # Reindex onto the complete timestamp range and forward fill the gaps,
+        # keeping only rows where we have actual or forward-filled data
+        df_chart = (
+            df_chart.drop_duplicates("timestamp", keep="last")
+            .set_index("timestamp")
+            .sort_index()
+            .asfreq(freq)
+            .ffill()
+            .dropna(subset=["close_price"])
+            .reset_index()
+        )
+    
+    # Only the plotted columns go into the Vega-Lite spec, downsampled to MAX_CHART_POINTS rows
+    # (LTTB on the price line; volume bars share the same picks so the panels stay aligned)
+    df_chart = df_chart[["timestamp", "close_price", "volume"]]
+    if len(df_chart) > MAX_CHART_POINTS:
+        keep = lttb_indices(
+            df_chart["timestamp"].to_numpy(dtype="datetime64[s]").astype(np.int64),
+            df_chart["close_price"].to_numpy(dtype=np.float64),
+            MAX_CHART_POINTS,
+        )
+        df_chart = df_chart.iloc[keep]
+    base = alt.Chart(df_chart)
     
     # Create price line chart (top)
-    price_chart = alt.Chart(df_chart).mark_line(point=False, strokeWidth=2).encode(
+    price_chart = base.mark_line(point=False, strokeWidth=2).encode(
         x=alt.X("timestamp:T", title="Date", scale=alt.Scale(nice=False)),
         y=alt.Y("close_price:Q", title="Price ($)", scale=alt.Scale(zero=False)),
         tooltip=["timestamp:T", "close_price:Q", "volume:Q"]
@@ -105,7 +159,7 @@ def create_line_chart(df: pd.DataFrame, title: str) -> alt.Chart:
     ).interactive()
     
     # Create volume chart (bottom)
-    volume_chart = alt.Chart(df_chart).mark_bar(opacity=0.7).encode(
+    volume_chart = base.mark_bar(opacity=0.7).encode(
         x=alt.X("timestamp:T", title="Date", scale=alt.Scale(nice=False)),
         y=alt.Y("volume:Q", title="Volume"),
         color=alt.value("#1f77b4"),
@@ -120,6 +174,138 @@ def create_line_chart(df: pd.DataFrame, title: str) -> alt.Chart:
     
     return combined_chart
 
+MIN_VOL = 1000  # 24h volume floor for markets offered in the picker
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_eligible(min_vol: int):
+    """
+    Markets with volume >= min_vol sorted by volume desc, plus their lowercased titles
+    for the filter box. Returns (None, None) when no markets could be loaded.
+    """
+    markets_df = get_unified_markets()
+    if markets_df.empty:
+        return None, None
+
+    if "volume" in markets_df.columns:
+        # one threshold pass + an argsort over the survivors only
+        vol = pd.to_numeric(markets_df["volume"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        keep = np.flatnonzero(vol >= min_vol)
+        eligible_df = markets_df.take(keep[np.argsort(-vol[keep], kind="stable")]).reset_index(drop=True)
+    else:
+        eligible_df = markets_df.iloc[:0]
+    titles_lower = eligible_df["title"].fillna("").astype(str).str.lower().to_numpy()
+    return eligible_df, titles_lower
+
+def _title_mask(titles_lower: np.ndarray, term: str) -> np.ndarray:
+    """Case-insensitive plain-substring match of term against the pre-lowered titles."""
+    if not term:
+        return np.ones(len(titles_lower), dtype=bool)
+    needle = term.lower()
+    return np.fromiter((needle in t for t in titles_lower), dtype=bool, count=len(titles_lower))
+
+def _daily_ohlcv_vwap_loop(codes, o, h, l, c, v, m, n_groups):
+    """
+    One pass over time-ordered candles grouped by codes (0..n_groups-1): first open,
+    max high, min low, last close, summed volume and VWAP, skipping NaNs like groupby.
+    """
+    out = np.full((6, n_groups), np.nan)
+    vol = np.zeros(n_groups)
+    pv = np.zeros(n_groups)
+    for i in range(len(codes)):
+        g = codes[i]
+        if not np.isnan(o[i]) and np.isnan(out[0, g]):
+            out[0, g] = o[i]
+        if not np.isnan(h[i]) and (np.isnan(out[1, g]) or h[i] > out[1, g]):
+            out[1, g] = h[i]
+        if not np.isnan(l[i]) and (np.isnan(out[2, g]) or l[i] < out[2, g]):
+            out[2, g] = l[i]
+        if not np.isnan(c[i]):
+            out[3, g] = c[i]
+        if not np.isnan(v[i]):
+            vol[g] += v[i]
+            if not np.isnan(m[i]):
+                pv[g] += m[i] * v[i]
+    for g in range(n_groups):
+        out[4, g] = vol[g]
+        if vol[g] > 0:
+            out[5, g] = pv[g] / vol[g]
+    return out
+
+if NUMBA_AVAILABLE:
+    _daily_ohlcv_vwap_jit = njit(cache=True)(_daily_ohlcv_vwap_loop)
+
+def _daily_table(df_c: pd.DataFrame) -> pd.DataFrame:
+    """Daily Open/High/Low/Close/Volume/VWAP indexed by Date, in date order."""
+    dates = df_c["timestamp"].dt.date
+    if NUMBA_AVAILABLE and len(df_c) >= NUMBA_MIN_ROWS:
+        # candles arrive ordered by end_period_ts, so factorize codes are already in date order
+        codes, uniques = pd.factorize(dates, sort=False)
+        cols = [df_c[f"{key}_price"].to_numpy(dtype=np.float64) for key in ("open", "high", "low", "close")]
+        out = _daily_ohlcv_vwap_jit(
+            codes.astype(np.int64), *cols,
+            df_c["volume"].to_numpy(dtype=np.float64),
+            df_c["mean_price"].to_numpy(dtype=np.float64),
+            len(uniques),
+        )
+        return pd.DataFrame(out.T, columns=["Open", "High", "Low", "Close", "Volume", "VWAP"],
+                            index=pd.Index(uniques, name="Date"))
+
+    df_daily = df_c.assign(date=dates, pv=df_c["mean_price"] * df_c["volume"])
+
+    # 1) Group OHLC + Volume + VWAP numerator in a single pass
+    #    (candles arrive ordered by end_period_ts, so groups are already in date order)
+    daily = df_daily.groupby("date", sort=False).agg(
+        Open=("open_price", "first"),
+        High=("high_price", "max"),
+        Low=("low_price", "min"),
+        Close=("close_price", "last"),
+        Volume=("volume", "sum"),
+        PV=("pv", "sum"),
+    )
+
+    # 2) Compute VWAP safely
+    daily["VWAP"] = np.where(daily["Volume"] > 0, daily["PV"] / daily["Volume"], np.nan)
+    daily = daily.drop(columns="PV")
+    daily.index.name = "Date"
+    return daily
+
+def _parse_open_ts(value) -> pd.Timestamp:
+    """
+    Default chart start from a market's open time (epoch seconds, ISO string or
+    Timestamp); falls back to a week ago when missing or unparseable.
+    """
+    fallback = pd.Timestamp.now() - pd.Timedelta(days=7)
+    if value is None or pd.isna(value):
+        return fallback
+    if isinstance(value, (int, float, np.integer, np.floating)) or (isinstance(value, str) and value.isdigit()):
+        ts = pd.to_datetime(int(value), unit="s", errors="coerce")
+    else:
+        ts = pd.to_datetime(value, errors="coerce")
+    return fallback if pd.isna(ts) else ts
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_overview(ticker: str, interval: str, start_ts: int, end_ts: int, chart_title: str):
+    """
+    Load candles, flatten OHLC and build the price/volume chart for one ticker and range.
+    Returns (df_c, chart_spec_json); the chart is serialized so the result is cacheable.
+    """
+    df_c = load_candles_from_store(ticker, interval, start_ts, end_ts)
+    if df_c.empty:
+        return df_c, None
+
+    #  ── Build DataFrame (optimized OHLC processing) ──────────────────────────
+    #  (you already have df_c columns: end_period_ts, price, volume)
+    df_c = df_c.copy()
+    df_c["timestamp"] = pd.to_datetime(df_c["end_period_ts"], unit="s")
+    
+    # Optimized: extract all OHLC values from the price dicts into one float array
+    df_c[[f"{key}_price" for key in PRICE_KEYS]] = _flatten_price(df_c["price"])
+    
+    chart = create_line_chart(df_c, chart_title)
+    # to_json runs the default data transformer, which refuses frames over 5000 rows
+    with alt.data_transformers.disable_max_rows():
+        return df_c, chart.to_json()
+
 def main():
     # Page title and description (no set_page_config needed for pages)
     st.title("Market Overview")
@@ -139,27 +325,7 @@ def main():
     st.info(f"📊 Showing data from: **{data_source_display}**")
 
     # Add CSS for clickable ticker styling
-    st.markdown("""
-        <style>
-        .stButton > button {
-            background: transparent;
-            color: #0066cc;
-            border: none;
-            text-decoration: underline;
-            font-weight: 500;
-            padding: 0;
-            margin: 0;
-            cursor: pointer;
-            text-align: left;
-            box-shadow: none;
-        }
-        .stButton > button:hover {
-            background: transparent;
-            color: #004499;
-            text-decoration: underline;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CLICKABLE_TICKER_CSS, unsafe_allow_html=True)
 
     # ── Handle deep-link via query params (e.g., ?ticker=XYZ&title=Name) ─────
     try:
@@ -183,18 +349,11 @@ def main():
         if qp_title:
             st.session_state.selected_title = qp_title
 
-    # ── Load markets (cached for 5m) ───────────────────────────────
-    markets_df = get_unified_markets()
-    if markets_df.empty:
+    # ── Load markets ≥ MIN_VOL, sorted by 24h volume desc (cached for 5m) ──
+    eligible_df, titles_lower = _load_eligible(MIN_VOL)
+    if eligible_df is None:
         st.error("Could not load markets—check your API key.")
         return
-
-    # ── Enforce min-volume and sort by 24h volume desc ─────────────
-    MIN_VOL = 1000
-    eligible_df = (
-        markets_df.loc[markets_df.get("volume", 0) >= MIN_VOL]
-        .sort_values("volume", ascending=False)
-    )
     if eligible_df.empty:
         st.warning("No markets meet the 24h volume threshold (>= 1,000).")
         return
@@ -202,74 +361,45 @@ def main():
     # ── Choose input mode ────────────────────────────────────────
     # Removed input mode toggle - simplified interface
     
-    # Check if we have a selected ticker from navigation
-    selected_ticker = st.session_state.get("selected_ticker")
-    selected_title = st.session_state.get("selected_title")
+    # Consume any selection handed over from navigation (one-shot, not persistent)
+    selected_ticker = st.session_state.pop("selected_ticker", None)
+    selected_title = st.session_state.pop("selected_title", None)
     
+    choice = None
     if selected_ticker and selected_title:
-        # Clear the session state to avoid persistent selection
-        del st.session_state.selected_ticker
-        del st.session_state.selected_title
-        
-        # Pre-populate the search with the selected title
-        term = selected_title
-        filt = eligible_df["title"].str.contains(term, case=False, na=False)
-        filtered = eligible_df.loc[filt]
-        
+        # Pre-select the exact title match, else the first title containing it
+        filtered = eligible_df.loc[_title_mask(titles_lower, selected_title)]
         if not filtered.empty:
-            # Find the exact match or closest match
-            exact_match = filtered[filtered["title"].str.lower() == selected_title.lower()]
-            if not exact_match.empty:
-                choice = exact_match.iloc[0]["title"]
-            else:
-                # Use the first match
-                choice = filtered.iloc[0]["title"]
-            
-            ticker = filtered.loc[filtered["title"] == choice, "ticker"].iloc[0]
-            display_name = choice
+            exact = filtered["title"].str.lower() == selected_title.lower()
+            choice = filtered.loc[exact, "title"].iloc[0] if exact.any() else filtered["title"].iloc[0]
         else:
-            # Fall back to default behavior
-            term = ""
-            filt = eligible_df["title"].str.contains(term, case=False, na=False)
-            filtered = eligible_df.loc[filt]
-            if filtered.empty:
-                st.warning("No markets match that filter (after applying ≥1k volume).")
-                return
-            titles = filtered["title"].tolist()
-            choice = st.selectbox("► Select a market", titles, index=0)
-            ticker = filtered.loc[filtered["title"] == choice, "ticker"].iloc[0]
-            display_name = choice
+            # Fall back to picking from every eligible market
+            filtered = eligible_df
     else:
         # Default behavior - no pre-selection
         term = st.text_input("🔍 Filter markets by title", "")
-        filt = eligible_df["title"].str.contains(term, case=False, na=False)
-        filtered = eligible_df.loc[filt]
+        filtered = eligible_df.loc[_title_mask(titles_lower, term)]
+    
+    if choice is None:
         if filtered.empty:
             st.warning("No markets match that filter (after applying ≥1k volume).")
             return
-        titles = filtered["title"].tolist()
-        choice = st.selectbox("► Select a market", titles, index=0)
-        ticker = filtered.loc[filtered["title"] == choice, "ticker"].iloc[0]
-        display_name = choice
+        choice = st.selectbox("► Select a market", filtered["title"].tolist(), index=0)
+    ticker = filtered.loc[filtered["title"] == choice, "ticker"].iloc[0]
+    display_name = choice
 
     st.subheader(f"Overview for {display_name}  ({ticker})")
 
-    # ── Date range & granularity ────────────────────────────────
-    interval = st.selectbox("Granularity", ["1m", "1h", "1d"], index=1)
     # Default to market open → today if available
-    row_for_default = markets_df.loc[markets_df["ticker"] == ticker].iloc[0]
+    row_for_default = eligible_df.loc[eligible_df["ticker"] == ticker].iloc[0]
     open_ts_val = row_for_default.get("open_time") or row_for_default.get("start_time")
-    try:
-        if pd.notna(open_ts_val):
-            # Handle both integer timestamps and ISO strings
-            if isinstance(open_ts_val, (int, float)) or str(open_ts_val).isdigit():
-                default_start = pd.to_datetime(int(open_ts_val), unit="s")
-            else:
-                default_start = pd.to_datetime(open_ts_val)
-        else:
-            default_start = pd.Timestamp.now() - pd.Timedelta(days=7)
-    except Exception:
-        default_start = pd.Timestamp.now() - pd.Timedelta(days=7)
+    _chart_panel(ticker, display_name, _parse_open_ts(open_ts_val))
+
+@st.fragment
+def _chart_panel(ticker: str, display_name: str, default_start: pd.Timestamp):
+    """Range/granularity pickers, chart and daily table; changing them reruns only this fragment."""
+    # ── Date range & granularity ────────────────────────────────
+    interval = st.selectbox("Granularity", ["1m", "1h", "1d"], index=1)
     default_end = pd.Timestamp.now()
 
     start_date, end_date = st.date_input(
@@ -281,10 +411,10 @@ def main():
     start_ts = int(start_dt.timestamp())
     end_ts   = int(end_dt.timestamp())
 
-    # ── Fetch candlesticks (still cached by get_client) ──────────
-    client = get_client()
+    # ── Fetch candlesticks + build chart (cached per ticker/range/interval) ──
+    chart_title = f"Price Evolution for {display_name} ({ticker})"
     try:
-        df_c = load_candles_from_store(ticker, interval, start_ts, end_ts)
+        df_c, chart_spec = _build_overview(ticker, interval, start_ts, end_ts, chart_title)
         if df_c.empty:
             st.warning("No cached data for that ticker/range—try rerunning the refresher.")
             return
@@ -295,62 +425,25 @@ def main():
         st.error(f"Error reading cached data: {e}")
         return
 
-    #  ── Build DataFrame (optimized OHLC processing) ──────────────────────────
-    #  (you already have df_c columns: end_period_ts, price, volume)
-    df_c["timestamp"] = pd.to_datetime(df_c["end_period_ts"], unit="s")
-    
-    # Optimized: extract all OHLC values in one vectorized operation
-    price_data = pd.json_normalize(df_c["price"])
-    df_c["open_price"]  = price_data.get("open", np.nan)
-    df_c["high_price"]  = price_data.get("high", np.nan)
-    df_c["low_price"]   = price_data.get("low", np.nan)
-    df_c["close_price"] = price_data.get("close", np.nan)
-    df_c["mean_price"]  = price_data.get("mean", np.nan)
-    
     # ── Create Line Chart with Volume ────────────────────────────
-    chart_title = f"Price Evolution for {display_name} ({ticker})"
-    chart = create_line_chart(df_c, chart_title)
-    st.altair_chart(chart, use_container_width=True)
+    st.vega_lite_chart(json.loads(chart_spec), use_container_width=True)
 
     # ── Daily Stats Table ────────────────────────────────────────
     st.subheader("Daily OHLC + Volume + VWAP")
-    df_daily = df_c.copy()
-    df_daily["date"] = df_daily["timestamp"].dt.date
-
-    # 1) Group OHLC + Volume
-    daily = df_daily.groupby("date").agg({
-        "open_price":  "first",
-        "high_price":  "max",
-        "low_price":   "min",
-        "close_price": "last",
-        "volume":      "sum",
-    })
-
-    # 2) Compute VWAP safely
-    vwap_num   = (df_daily["mean_price"] * df_daily["volume"]).groupby(df_daily["date"]).sum()
-    vwap_denom = daily["volume"]
-    daily["VWAP"] = np.where(vwap_denom > 0, vwap_num / vwap_denom, np.nan)
-
-    # 3) Rename for display
-    daily = daily.rename(columns={
-        "open_price":  "Open",
-        "high_price":  "High",
-        "low_price":   "Low",
-        "close_price": "Close",
-        "volume":      "Volume",
-    })
-    daily.index.name = "Date"
+    daily = _daily_table(df_c)
 
-    # 4) Show table
+    # Show table (formatted client-side via column_config, no Styler)
     st.dataframe(
-        daily.style.format({
-            "Open":   "${:,.2f}",
-            "High":   "${:,.2f}",
-            "Low":    "${:,.2f}",
-            "Close":  "${:,.2f}",
-            "Volume": "{:,.0f}",
-            "VWAP":   "${:,.2f}"
-        }),
+        daily.reset_index(),
+        column_config={
+            "Open":   st.column_config.NumberColumn("Open", format="$%.2f"),
+            "High":   st.column_config.NumberColumn("High", format="$%.2f"),
+            "Low":    st.column_config.NumberColumn("Low", format="$%.2f"),
+            "Close":  st.column_config.NumberColumn("Close", format="$%.2f"),
+            "Volume": st.column_config.NumberColumn("Volume", format="localized"),
+            "VWAP":   st.column_config.NumberColumn("VWAP", format="$%.2f"),
+        },
+        hide_index=True,
         use_container_width=True,
         height=300,
     )
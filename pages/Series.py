@@ -6,6 +6,8 @@ import altair as alt
 import datetime
 import numpy as np
 from html import escape
+from urllib.parse import quote
+from operator import itemgetter
 
 # Import helper to fix path issues
 import import_helper
@@ -19,7 +21,7 @@ except ImportError:
     KalshiClient = None
 
 try:
-    from utils import load_series_data_from_store, API_KEY, get_volume_columns, load_candles_from_store, make_ticker_clickable, make_title_clickable
+    from utils import load_series_data_from_store, API_KEY, get_volume_columns, load_candles_from_store_batch, load_daily_volume_from_store, lttb_indices, make_ticker_clickable, make_title_clickable
     UTILS_AVAILABLE = True
 except ImportError as e:
     UTILS_AVAILABLE = False
@@ -30,24 +32,84 @@ except ImportError as e:
         return [], pd.DataFrame()
     def get_volume_columns(df):
         return pd.Series(0, index=df.index), pd.Series(0, index=df.index)
-    def load_candles_from_store(ticker, granularity, start_ts, end_ts):
-        return pd.DataFrame()
+    def load_candles_from_store_batch(tickers, granularity, start_ts, end_ts):
+        return pd.DataFrame(columns=["ticker", "end_period_ts", "price", "volume"])
+    def load_daily_volume_from_store(tickers, start_ts, end_ts):
+        return pd.DataFrame(columns=["date", "volume"])
+    def lttb_indices(x, y, n_out):
+        return np.linspace(0, len(x) - 1, min(n_out, len(x))).astype(np.int64)
     def make_ticker_clickable(ticker, display_text=None, key=None):
         return False
     def make_title_clickable(title, ticker=None, key=None):
         return False
 
-@st.cache_data(ttl=300)
+# Sub-series code → human-readable name (common tournament/event mappings)
+_DISPLAY_NAMES = {
+    # PGA Tour events
+    "FSJC25": "FedEx St Jude Championship",
+    "BC25": "BMW Championship",
+    "TC25": "Tour Championship",
+    # Add more as needed
+}
+
+# Top-series card grid: 6 uniform cards per row, each card is a ?series= link
+SERIES_GRID_CSS = """
+<style>
+.series-grid{display:grid;grid-template-columns:repeat(6,1fr);gap:12px;margin-bottom:12px}
+.series-card{border:1px solid #e5e7eb;border-radius:10px;padding:12px;height:110px;display:flex;flex-direction:column;justify-content:space-between;background:#fff;text-decoration:none !important;color:inherit !important}
+.series-card:hover{border-color:#0066cc}
+.series-card .title{font-weight:600;line-height:1.2;max-height:3.0em;overflow:hidden;}
+.series-card .amt{font-weight:700;color:#111827}
+</style>
+"""
+
+# Optional Rust/SIMD downsampler for chart lines; falls back to the numpy LTTB in utils
+try:
+    from tsdownsample import M4Downsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+    M4Downsampler = None
+
+MAX_POINTS_PER_TICKER = 1200  # ~2x chart width; M4 needs a multiple of 4
+
+def _downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions of at most n_out points that keep the shape of one ticker's line."""
+    if TSDOWNSAMPLE_AVAILABLE:
+        return np.asarray(M4Downsampler().downsample(x, y, n_out=n_out), dtype=np.int64)
+    return lttb_indices(x, y, n_out)
+
+@st.cache_resource(ttl=300, show_spinner=False)
 def load_markets_for_series(series_ticker: str) -> pd.DataFrame:
     """
     Fetch all markets (open + closed) in a given series.
+    Shared across sessions and returned without a copy, so callers must not mutate it.
     """
     if not KALSHI_CLIENT_AVAILABLE:
         st.warning("KalshiClient is not available. Cannot fetch markets.")
         return pd.DataFrame()
     client = KalshiClient(api_key=API_KEY)
     resp = client.get_markets(limit=1000, series_ticker=series_ticker, status="open")
-    return pd.DataFrame(resp.get("markets", []))
+    df = pd.DataFrame(resp.get("markets", []))
+    # Parse open/close times once here (tz-naive UTC) instead of on every rerun
+    for col in ("open_time", "close_time"):
+        if col in df.columns:
+            df[f"{col}_dt"] = pd.to_datetime(df[col], utc=True, errors="coerce").dt.tz_convert(None)
+    # Sub-series key used by the selector, charts and table filter
+    if "ticker" in df.columns:
+        df["subseries"] = extract_subseries_vec(df["ticker"], series_ticker).astype("category")
+    return df
+
+def _hour_window(start_ts: int, end_ts: int) -> tuple:
+    """
+    Widen [start_ts, end_ts] to whole hours, so reruns inside the same hour pass the
+    same bounds to the cached store reads instead of missing the cache.
+    """
+    return start_ts // 3600 * 3600, -(-end_ts // 3600) * 3600
+
+def _load_chart_candles(tickers: tuple, start_ts: int, end_ts: int) -> pd.DataFrame:
+    """Hourly candles for the chart tickers over the hour-bucketed window."""
+    return load_candles_from_store_batch(tuple(tickers), "1h", *_hour_window(start_ts, end_ts))
 
 def extract_subseries(ticker: str, series_ticker: str) -> str:
     """
@@ -67,21 +129,30 @@ def extract_subseries(ticker: str, series_ticker: str) -> str:
         return parts[0] if parts else remainder
     return ticker
 
-def get_subseries_display_name(subseries_code: str, series_ticker: str) -> str:
+def extract_subseries_vec(tickers: pd.Series, series_ticker: str) -> pd.Series:
     """
-    Convert subseries code to human-readable name.
+    Vectorized extract_subseries over a ticker column (same results, no per-row calls).
     """
-    # Common tournament/event mappings
-    display_names = {
-        # PGA Tour events
-        "FSJC25": "FedEx St Jude Championship",
-        "BC25": "BMW Championship",
-        "TC25": "Tour Championship",
-        # Add more as needed
-    }
+    tickers = tickers.fillna("").astype(str)
+    if not series_ticker:
+        return pd.Series("Unknown", index=tickers.index)
     
-    # If we have a mapping, use it. Otherwise use the code.
-    return display_names.get(subseries_code, subseries_code)
+    prefix = series_ticker + "-"
+    subseries = tickers.str.slice(len(prefix)).str.split("-", n=1).str[0]
+    subseries = subseries.where(tickers.str.startswith(prefix), tickers)
+    return subseries.mask(tickers == "", "Unknown")
+
+def _subseries_column(markets_df: pd.DataFrame, series_ticker: str) -> pd.Series:
+    """The subseries column added by load_markets_for_series, computed here if absent."""
+    if "subseries" in markets_df.columns:
+        return markets_df["subseries"]
+    return extract_subseries_vec(markets_df["ticker"], series_ticker)
+
+def get_subseries_display_name(subseries_code: str, series_ticker: str) -> str:
+    """
+    Convert subseries code to human-readable name (the code itself if unmapped).
+    """
+    return _DISPLAY_NAMES.get(subseries_code, subseries_code)
 
 def get_unique_subseries(markets_df: pd.DataFrame, series_ticker: str) -> list:
     """
@@ -91,19 +162,16 @@ def get_unique_subseries(markets_df: pd.DataFrame, series_ticker: str) -> list:
     if markets_df.empty:
         return []
     
-    markets_df = markets_df.copy()
-    markets_df["subseries"] = markets_df["ticker"].apply(lambda x: extract_subseries(x, series_ticker))
-    
-    # Count markets per subseries
-    subseries_counts = markets_df["subseries"].value_counts()
-    
+    # Count markets per subseries: dense histogram over the category codes, count desc
+    subseries = _subseries_column(markets_df, series_ticker).astype("category")
+    codes = subseries.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(subseries.cat.categories))
+    order = np.argsort(-counts, kind="stable")
     result = []
-    for subseries_code, count in subseries_counts.items():
-        if subseries_code and subseries_code != "Unknown":
-            display_name = get_subseries_display_name(subseries_code, series_ticker)
-            result.append((subseries_code, display_name, count))
-    
-    return sorted(result, key=lambda x: x[2], reverse=True)  # Sort by count desc
+    for code, count in zip(subseries.cat.categories[order], counts[order].tolist()):
+        if count and code and code != "Unknown":
+            result.append((code, _DISPLAY_NAMES.get(code, code), count))
+    return result
 
 def create_subseries_chart(markets_df: pd.DataFrame, series_ticker: str, selected_subseries: str = None, start_date: datetime.date = None, end_date: datetime.date = None) -> alt.Chart:
     """
@@ -113,13 +181,9 @@ def create_subseries_chart(markets_df: pd.DataFrame, series_ticker: str, selecte
     if markets_df.empty:
         return alt.Chart().mark_text().encode(text=alt.value("No data available"))
     
-    # Extract sub-series for each market
-    markets_df = markets_df.copy()
-    markets_df["subseries"] = markets_df["ticker"].apply(lambda x: extract_subseries(x, series_ticker))
-    
     # Filter to selected sub-series if specified
     if selected_subseries:
-        markets_df = markets_df[markets_df["subseries"] == selected_subseries]
+        markets_df = markets_df[_subseries_column(markets_df, series_ticker) == selected_subseries]
         if markets_df.empty:
             return alt.Chart().mark_text().encode(text=alt.value(f"No markets found for sub-series: {selected_subseries}"))
     
@@ -133,8 +197,8 @@ def create_subseries_chart(markets_df: pd.DataFrame, series_ticker: str, selecte
         end_ts = int(pd.Timestamp(end_date).timestamp())
         # Filter markets by date range - show markets that are active during the period
         # (markets that either opened during the period OR are still active)
-        open_dt = pd.to_datetime(top_10_markets["open_time"], utc=True, errors="coerce").dt.tz_convert(None)
-        close_dt = pd.to_datetime(top_10_markets["close_time"], utc=True, errors="coerce").dt.tz_convert(None)
+        open_dt = top_10_markets["open_time_dt"]
+        close_dt = top_10_markets["close_time_dt"]
         start_naive = pd.Timestamp(start_date)
         end_naive = pd.Timestamp(end_date)
         
@@ -148,85 +212,71 @@ def create_subseries_chart(markets_df: pd.DataFrame, series_ticker: str, selecte
     if top_10_markets.empty:
         return alt.Chart().mark_text().encode(text=alt.value("No markets found in selected date range"))
     
-    # Create chart data
-    chart_data = []
-    for _, market in top_10_markets.iterrows():
-        ticker = market["ticker"]
-        title = market["title"]
-        
-        # Load candle data for this market
-        try:
-            candles = load_candles_from_store(ticker, "1h", start_ts, end_ts)
-            if not candles.empty:
-                candles = candles.copy()
-                # Normalize candle fields - handle both dict and direct price formats
-                if "price" in candles.columns:
-                    if isinstance(candles["price"].iloc[0], dict):
-                        price_df = pd.json_normalize(candles["price"])
-                        candles["close_price"] = price_df.get("close", np.nan)
-                    else:
-                        # If price is already a scalar, use it directly
-                        candles["close_price"] = candles["price"]
-                else:
-                    # Fallback: use last_price if available
-                    candles["close_price"] = market.get("last_price", market.get("yes_bid", np.nan))
-                
-                candles["timestamp"] = candles["end_period_ts"]
-                candles["ticker"] = ticker
-                candles["title"] = title
-                chart_data.append(candles[["timestamp", "close_price", "volume", "ticker", "title"]])
-        except Exception as e:
-            # Create dummy data point using current market price for markets without candle data
+    # Create chart data: one batched candle read for all charted markets
+    all_candles = None
+    tickers = tuple(top_10_markets["ticker"].astype(str))
+    titles = dict(zip(tickers, top_10_markets["title"]))
+    try:
+        candles = _load_chart_candles(tickers, start_ts, end_ts)
+        if not candles.empty:
+            # the cached loader hands back a fresh frame, so derive columns in place
+            # Normalize candle fields - handle both dict and direct price formats
+            if isinstance(candles["price"].iloc[0], dict):
+                candles["close_price"] = candles["price"].map(itemgetter("close"), na_action="ignore")
+            else:
+                # If price is already a scalar, use it directly
+                candles["close_price"] = candles["price"]
+            
+            candles["timestamp"] = candles["end_period_ts"]
+            candles["title"] = candles["ticker"].map(titles)
+            all_candles = candles[["timestamp", "close_price", "volume", "ticker", "title"]]
+    except Exception as e:
+        # Create dummy data points using current market prices when candle data can't be loaded,
+        # collected column-wise and turned into one frame at the end
+        buf = {"timestamp": [], "close_price": [], "volume": [], "ticker": [], "title": []}
+        for market in top_10_markets.to_dict("records"):
             current_price = market.get("last_price", market.get("yes_bid", np.nan))
             if pd.notna(current_price):
-                dummy_data = pd.DataFrame({
-                    "timestamp": [end_ts],
-                    "close_price": [current_price],
-                    "volume": [market.get("volume", 0)],
-                    "ticker": [ticker],
-                    "title": [title]
-                })
-                chart_data.append(dummy_data)
+                buf["timestamp"].append(end_ts)
+                buf["close_price"].append(current_price)
+                buf["volume"].append(market.get("volume", 0))
+                buf["ticker"].append(market["ticker"])
+                buf["title"].append(market["title"])
             else:
-                st.warning(f"Could not load candle data for {ticker}: {str(e)}")
-            continue
+                st.warning(f"Could not load candle data for {market['ticker']}: {str(e)}")
+        if buf["ticker"]:
+            all_candles = pd.DataFrame(buf)
     
-    if not chart_data:
+    if all_candles is None:
         return alt.Chart().mark_text().encode(text=alt.value("No historical data available for selected markets"))
     
-    # Combine all candle data
-    all_candles = pd.concat(chart_data, ignore_index=True)
+    all_candles = all_candles.astype({"close_price": "float32", "volume": "float32"})
     
     # Convert timestamp to datetime for Altair
     all_candles["datetime"] = pd.to_datetime(all_candles["timestamp"], unit="s")
     
-    # Ensure continuous lines per ticker by forward-filling over complete timestamp ranges
-    def infer_freq(delta_seconds: float) -> str:
-        if delta_seconds <= 60:
-            return "1min"
-        if delta_seconds <= 3600:
-            return "1H"
-        return "1D"
-
-    filled_parts = []
-    for tkr, g in all_candles.sort_values("datetime").groupby("ticker"):
-        if len(g) >= 2:
-            deltas = (g["datetime"].diff().dropna().dt.total_seconds())
-            step = deltas.mode().iloc[0] if not deltas.empty else 3600
-            freq = infer_freq(step)
-        else:
-            freq = "1H"
-        full_range = pd.date_range(start=g["datetime"].min(), end=g["datetime"].max(), freq=freq)
-        g2 = g.set_index("datetime").reindex(full_range)
-        g2[["close_price", "volume"]] = g2[["close_price", "volume"]].ffill()
-        g2["ticker"] = tkr
-        g2["title"] = g["title"].iloc[0]
-        g2 = g2.reset_index().rename(columns={"index": "datetime"})
-        filled_parts.append(g2)
-    all_candles = pd.concat(filled_parts, ignore_index=True)
+    # Only the real candles are sent: the step-after line below holds each close until the
+    # next candle, which draws the same continuous line a forward-filled grid used to
+    all_candles = (
+        all_candles.drop_duplicates(["ticker", "datetime"], keep="last")
+        .dropna(subset=["close_price"])
+        .sort_values(["ticker", "datetime"], ignore_index=True)
+    )
+    all_candles["title"] = all_candles["ticker"].map(titles)
+    
+    # Cap each ticker's line at MAX_POINTS_PER_TICKER points before it goes to the browser
+    x = all_candles["datetime"].to_numpy(dtype="datetime64[s]").astype(np.int64)
+    y = all_candles["close_price"].to_numpy()
+    keep = []
+    for pos in all_candles.groupby("ticker").indices.values():
+        if len(pos) > MAX_POINTS_PER_TICKER:
+            pos = pos[_downsample_indices(x[pos], y[pos], MAX_POINTS_PER_TICKER)]
+        keep.append(pos)
+    all_candles = all_candles.iloc[np.sort(np.concatenate(keep))]
+    all_candles = all_candles.astype({"ticker": "category", "title": "category"})
 
     # Create the chart
-    chart = alt.Chart(all_candles).mark_line().encode(
+    chart = alt.Chart(all_candles).mark_line(interpolate="step-after").encode(
         x=alt.X("datetime:T", title="Date", axis=alt.Axis(format="%m/%d")),
         y=alt.Y("close_price:Q", title="Close Price ($)", scale=alt.Scale(zero=False)),
         color=alt.Color("ticker:N", title="Market", legend=alt.Legend(title="Markets")),
@@ -254,7 +304,7 @@ def create_volume_chart(markets_df: pd.DataFrame, series_ticker: str, selected_s
     
     # Filter to selected sub-series if specified
     if selected_subseries:
-        markets_df = markets_df[markets_df["ticker"].apply(lambda x: extract_subseries(x, series_ticker)) == selected_subseries]
+        markets_df = markets_df[_subseries_column(markets_df, series_ticker) == selected_subseries]
         if markets_df.empty:
             return alt.Chart().mark_text().encode(text=alt.value(f"No markets found for sub-series: {selected_subseries}"))
     
@@ -266,35 +316,19 @@ def create_volume_chart(markets_df: pd.DataFrame, series_ticker: str, selected_s
         end_ts = int(pd.Timestamp.now().timestamp())
         start_ts = int((pd.Timestamp.now() - pd.Timedelta(days=30)).timestamp())
 
-    # Create chart data
-    chart_data = []
-    for _, market in markets_df.iterrows():
-        ticker = market["ticker"]
-        
-        # Load candle data for this market
-        try:
-            candles = load_candles_from_store(ticker, "1h", start_ts, end_ts)
-            if not candles.empty:
-                candles = candles.copy()
-                candles["timestamp"] = candles["end_period_ts"]
-                candles["ticker"] = ticker
-                chart_data.append(candles[["timestamp", "volume", "ticker"]])
-        except Exception as e:
-            continue
+    # Daily volume summed in the store (hour-bucketed window, like the price chart)
+    try:
+        daily_volume = load_daily_volume_from_store(
+            tuple(markets_df["ticker"].astype(str)), *_hour_window(start_ts, end_ts)
+        )
+    except Exception:
+        daily_volume = pd.DataFrame()
     
-    if not chart_data:
+    if daily_volume.empty:
         return alt.Chart().mark_text().encode(text=alt.value("No historical data available"))
     
-    # Combine all candle data
-    all_candles = pd.concat(chart_data, ignore_index=True)
-    
-    # Convert timestamp to datetime for Altair
-    all_candles["datetime"] = pd.to_datetime(all_candles["timestamp"], unit="s")
-    
-    # Aggregate volume by date
-    all_candles["date"] = all_candles["datetime"].dt.date
-    daily_volume = all_candles.groupby("date")["volume"].sum().reset_index()
-    daily_volume["datetime"] = pd.to_datetime(daily_volume["date"])
+    daily_volume = daily_volume.rename(columns={"date": "datetime"})
+    daily_volume["volume"] = daily_volume["volume"].astype("float32")
     
     # Filter by date range if specified
     if start_date and end_date:
@@ -356,31 +390,16 @@ def main():
         
         # ── Clean card grid (4 x 6), uniform size, bold amount ─────────────
         st.subheader("Top 24 Series by 24h Volume")
-        st.markdown(
-            """
-            <style>
-            .series-card{border:1px solid #e5e7eb;border-radius:10px;padding:12px;height:110px;display:flex;flex-direction:column;justify-content:space-between;background:#fff}
-            .series-card .title{font-weight:600;line-height:1.2;max-height:3.0em;overflow:hidden;}
-            .series-card .amt{font-weight:700;color:#111827}
-            .series-card-btn > button{width:100%}
-            </style>
-            """,
-            unsafe_allow_html=True,
+        series_sorted = series_df.assign(_vol24=pd.to_numeric(vol24_series, errors="coerce").fillna(0)).nlargest(24, "_vol24")
+        # One HTML grid (6 per row); each card links to ?series=..., which the deep-link code below picks up
+        titles = series_sorted["title"] if "title" in series_sorted.columns else pd.Series("", index=series_sorted.index)
+        tickers = series_sorted["series_ticker"] if "series_ticker" in series_sorted.columns else pd.Series("", index=series_sorted.index)
+        cards = "".join(
+            f"<a class='series-card' href='?series={quote(str(sr))}' target='_self'>"
+            f"<div class='title'>{escape(str(title_txt))}</div><div class='amt'>${vol_val:,.0f}</div></a>"
+            for title_txt, sr, vol_val in zip(titles.fillna(""), tickers.fillna(""), series_sorted["_vol24"])
         )
-        series_sorted = series_df.assign(_vol24=vol24_series.fillna(0)).sort_values("_vol24", ascending=False).head(24)
-        # Render in chunks of 6 per row (4 rows)
-        for start in range(0, len(series_sorted), 6):
-            cols = st.columns(6)
-            chunk = series_sorted.iloc[start:start+6]
-            for idx, (_, row) in enumerate(chunk.iterrows()):
-                with cols[idx]:
-                    title_txt = str(row.get("title", ""))
-                    vol_val = row.get("_vol24", 0)
-                    sr = str(row.get("series_ticker", ""))
-                    st.markdown(f"<div class='series-card'><div class='title'>{escape(title_txt)}</div><div class='amt'>${vol_val:,.0f}</div></div>", unsafe_allow_html=True)
-                    if st.button("Select", key=f"series_card_{start}_{idx}"):
-                        st.session_state.selected_series = sr
-                        st.rerun()
+        st.markdown(SERIES_GRID_CSS + f"<div class='series-grid'>{cards}</div>", unsafe_allow_html=True)
         
         st.divider()
         
@@ -429,14 +448,14 @@ def main():
                     )
                     selected_subseries_code = selected_subseries.split(" - ")[0]
                 
-                markets_df_filtered = markets_df[markets_df["ticker"].apply(lambda x: extract_subseries(x, selected) == selected_subseries_code)]
+                markets_df_filtered = markets_df[markets_df["subseries"] == selected_subseries_code]
                 
                 # Date range selector
                 with st.expander("📅 Date Range Selection", expanded=False):
                     # Default to last 30 days, but allow custom range
                     if not markets_df_filtered.empty:
-                        open_times = pd.to_datetime(markets_df_filtered["open_time"], utc=True, errors="coerce").dt.tz_convert(None)
-                        close_times = pd.to_datetime(markets_df_filtered["close_time"], utc=True, errors="coerce").dt.tz_convert(None)
+                        open_times = markets_df_filtered["open_time_dt"]
+                        close_times = markets_df_filtered["close_time_dt"]
                         if not open_times.empty and not close_times.empty:
                             default_start = open_times.min().date()
                             default_end = close_times.max().date()
@@ -459,8 +478,8 @@ def main():
                 # For a chosen sub-series, display full historical timeseries for its markets
                 # Use earliest open_time and latest close_time to build full window
                 if not markets_df_filtered.empty:
-                    open_times = pd.to_datetime(markets_df_filtered["open_time"], utc=True, errors="coerce").dt.tz_convert(None)
-                    close_times = pd.to_datetime(markets_df_filtered["close_time"], utc=True, errors="coerce").dt.tz_convert(None)
+                    open_times = markets_df_filtered["open_time_dt"]
+                    close_times = markets_df_filtered["close_time_dt"]
                     start_date_full = open_times.min().date() if not open_times.empty else (pd.Timestamp.now() - pd.Timedelta(days=30)).date()
                     end_date_full = close_times.max().date() if not close_times.empty else pd.Timestamp.now().date()
                 else:
@@ -468,7 +487,7 @@ def main():
                     end_date_full = pd.Timestamp.now().date()
                 # Force chart to re-render on each (series, subseries) change and include all markets if fewer than 10
                 st.write("")
-                chart = create_subseries_chart(markets_df_filtered.copy(), selected, selected_subseries_code, start_date_full, end_date_full)
+                chart = create_subseries_chart(markets_df_filtered, selected, selected_subseries_code, start_date_full, end_date_full)
                 st.altair_chart(chart, use_container_width=True)
                 
                 st.markdown("---")
@@ -482,11 +501,11 @@ def main():
             # Only show bottom section (chart + table) after series is chosen and we have data
             if not markets_df_filtered.empty:
                 # Normalize columns and build tidy display with consistent volume logic
-                dfm = markets_df_filtered.copy()
+                dfm = markets_df_filtered
                 vol24_series, total_vol_series = get_volume_columns(dfm)
 
                 # Sort by Yes Bid descending
-                dfm_sorted = dfm.assign(_yes_bid=dfm["yes_bid"].fillna(0)).sort_values("_yes_bid", ascending=False).drop(columns=["_yes_bid"])
+                dfm_sorted = dfm.iloc[np.argsort(-dfm["yes_bid"].fillna(0).to_numpy(dtype=float), kind="stable")]
                 display_df = dfm_sorted[[
                     "ticker","title","yes_sub_title","no_sub_title","yes_bid","yes_ask","no_bid","no_ask","last_price","open_interest","close_time"
                 ]].rename(columns={
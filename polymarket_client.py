@@ -1,12 +1,24 @@
 # polymarket_client.py
 
+import atexit
 import requests
+import numpy as np
 import pandas as pd
 import json
 from datetime import datetime
 from typing import List, Dict, Optional, Any
+import threading
 import time
 
+# Optional C-accelerated JSON decoder; stdlib json accepts the same str/bytes input
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 class PolymarketClient:
     def __init__(self):
         """
@@ -23,24 +35,39 @@ class PolymarketClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"]
         )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=retries
+        )
         self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
         
-        # Rate limiting - be respectful
-        self.last_request_time = 0
+        # Rate limiting - be respectful (slots are reserved under a lock so the
+        # client can be shared across threads without serialising on sleeps)
         self.min_request_interval = 0.1  # 100ms between requests
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        
+        # Short-lived cache of the full /markets payload so the filter methods
+        # below share one fetch; the lock also collapses concurrent fetches
+        self._cache: Optional[tuple] = None  # (monotonic fetch time, markets)
+        self._cache_ttl = 45.0
+        self._cache_lock = threading.Lock()
     
     def _rate_limit(self):
-        """Simple rate limiting to be respectful to the API"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
+        """Reserve the next request slot and sleep (outside the lock) until it opens"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self.min_request_interval
+        if slot > now:
+            time.sleep(slot - now)
     
     def get_markets(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Fetch all markets from Polymarket.
+        Fetch all markets from Polymarket (reusing the last payload for up to
+        _cache_ttl seconds).
         
         Args:
             limit: Optional limit on number of markets to return
@@ -48,19 +75,32 @@ class PolymarketClient:
         Returns:
             List of market dictionaries
         """
+        with self._cache_lock:
+            if self._cache is not None and time.monotonic() - self._cache[0] < self._cache_ttl:
+                markets = self._cache[1]
+            elif limit:
+                # Cold cache and only a few rows wanted: let the server truncate
+                # the payload instead of downloading the full list (not cached)
+                return self._fetch_markets({"limit": limit})[:limit]
+            else:
+                markets = self._fetch_markets()
+                if not markets:
+                    return []
+                self._cache = (time.monotonic(), markets)
+        
+        # Hand out a shallow copy so callers can't mutate the cached list
+        return markets[:limit] if limit else list(markets)
+    
+    def _fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Issue one rate-limited GET /markets; returns [] on failure"""
         self._rate_limit()
         
         try:
-            response = self.session.get(f"{self.base_url}/markets", timeout=30)
+            response = self.session.get(f"{self.base_url}/markets", params=params, timeout=30)
             response.raise_for_status()
-            markets = response.json()
-            
-            if limit:
-                markets = markets[:limit]
-            
-            return markets
+            return _json_loads(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching Polymarket markets: {e}")
             return []
     
@@ -126,6 +166,90 @@ class PolymarketClient:
         all_markets = self.get_markets()
         return [m for m in all_markets if m.get('volumeNum', 0) >= min_volume]
 
+# ── Normalized field mappings (output column → raw Gamma API field) ──
+_NUMERIC_FIELDS = {
+    'last_price': 'lastTradePrice',
+    'yes_bid': 'bestBid',
+    'yes_ask': 'bestAsk',
+    'volume_24h': 'volume24hr',
+    'volume_1wk': 'volume1wk',
+    'volume_1mo': 'volume1mo',
+    'volume_total': 'volumeNum',
+    'liquidity': 'liquidityNum',
+    'price_change_1h': 'oneHourPriceChange',
+    'price_change_24h': 'oneDayPriceChange',
+    'price_change_1w': 'oneWeekPriceChange',
+    'spread': 'spread',
+}
+_TEXT_FIELDS = {
+    'title': 'question',
+    'category': 'category',
+    'slug': 'slug',
+    'description': 'description',
+    'market_type': 'marketType',
+}
+_RAW_FIELDS = sorted(
+    {'id', 'outcomes', 'outcomePrices', 'createdAt', 'endDate', 'closed', 'active'}
+    | set(_NUMERIC_FIELDS.values()) | set(_TEXT_FIELDS.values())
+)
+
+# Prices and price changes live in [-1, 1], so float32 is exact enough; the
+# volume and liquidity dollar totals stay float64 (float32 would round them)
+_FLOAT32_COLUMNS = (
+    'last_price', 'yes_bid', 'yes_ask', 'spread',
+    'price_change_1h', 'price_change_24h', 'price_change_1w',
+)
+
+# Low-cardinality labels stored as categoricals in the normalized frame
+_CATEGORY_COLUMNS = ('category', 'status', 'market_type', 'data_source')
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store prices as float32 and repeated labels as category; volumes keep float64"""
+    for col in _FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('float32')
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def _parse_outcomes(outcomes_raw: Any, prices_raw: Any) -> tuple:
+    """Decode the JSON-string outcomes/outcomePrices pair into (list, dict)"""
+    try:
+        outcomes = _json_loads(outcomes_raw) if isinstance(outcomes_raw, str) else []
+        outcome_prices = _json_loads(prices_raw) if isinstance(prices_raw, str) else {}
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+        return [], {}
+    
+    # Convert outcome prices to dict if it's a list
+    if isinstance(outcome_prices, list) and len(outcomes) == len(outcome_prices):
+        outcome_prices = dict(zip(outcomes, outcome_prices))
+    
+    return outcomes, outcome_prices
+
+# Scalar field coercions: None and unparseable values are treated like missing
+# fields, matching the pd.to_numeric / pd.to_datetime coercion in the batch path
+def _to_float(value: Any) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if number != number else number
+
+def _to_text(value: Any) -> Any:
+    return '' if value is None else value
+
+def _to_id(value: Any) -> str:
+    return '' if value is None else str(value)
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
 def normalize_polymarket_market(market: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize Polymarket market data to a common format.
@@ -137,33 +261,11 @@ def normalize_polymarket_market(market: Dict[str, Any]) -> Dict[str, Any]:
         Normalized market data
     """
     # Parse outcomes (they come as JSON strings)
-    outcomes = []
-    outcome_prices = {}
-    
-    try:
-        if isinstance(market.get('outcomes'), str):
-            outcomes = json.loads(market.get('outcomes', '[]'))
-        if isinstance(market.get('outcomePrices'), str):
-            outcome_prices = json.loads(market.get('outcomePrices', '[]'))
-    except json.JSONDecodeError:
-        outcomes = []
-        outcome_prices = {}
+    outcomes, outcome_prices = _parse_outcomes(market.get('outcomes'), market.get('outcomePrices'))
     
-    # Convert outcome prices to dict if it's a list
-    if isinstance(outcome_prices, list) and len(outcomes) == len(outcome_prices):
-        outcome_prices = dict(zip(outcomes, outcome_prices))
-    
-    # Parse dates
-    open_time = None
-    close_time = None
-    
-    try:
-        if market.get('createdAt'):
-            open_time = datetime.fromisoformat(market['createdAt'].replace('Z', '+00:00'))
-        if market.get('endDate'):
-            close_time = datetime.fromisoformat(market['endDate'].replace('Z', '+00:00'))
-    except (ValueError, TypeError):
-        pass
+    # Parse dates (each independently, so one bad field doesn't drop the other)
+    open_time = _parse_iso(market.get('createdAt'))
+    close_time = _parse_iso(market.get('endDate'))
     
     # Determine status
     if market.get('closed'):
@@ -175,45 +277,94 @@ def normalize_polymarket_market(market: Dict[str, Any]) -> Dict[str, Any]:
     
     # Normalize the data
     normalized = {
-        'market_id': str(market.get('id', '')),
-        'title': market.get('question', ''),
-        'category': market.get('category', ''),
+        'market_id': _to_id(market.get('id')),
+        'title': _to_text(market.get('question')),
+        'category': _to_text(market.get('category')),
         'outcomes': outcomes,
         'outcome_prices': outcome_prices,
-        'last_price': float(market.get('lastTradePrice', 0)),
-        'yes_bid': float(market.get('bestBid', 0)),
-        'yes_ask': float(market.get('bestAsk', 0)),
-        'volume_24h': float(market.get('volume24hr', 0)),
-        'volume_1wk': float(market.get('volume1wk', 0)),
-        'volume_1mo': float(market.get('volume1mo', 0)),
-        'volume_total': float(market.get('volumeNum', 0)),
-        'liquidity': float(market.get('liquidityNum', 0)),
+        'last_price': _to_float(market.get('lastTradePrice')),
+        'yes_bid': _to_float(market.get('bestBid')),
+        'yes_ask': _to_float(market.get('bestAsk')),
+        'volume_24h': _to_float(market.get('volume24hr')),
+        'volume_1wk': _to_float(market.get('volume1wk')),
+        'volume_1mo': _to_float(market.get('volume1mo')),
+        'volume_total': _to_float(market.get('volumeNum')),
+        'liquidity': _to_float(market.get('liquidityNum')),
         'close_time': close_time,
         'open_time': open_time,
         'status': status,
         'closed': bool(market.get('closed', False)),
-        'price_change_1h': float(market.get('oneHourPriceChange', 0)),
-        'price_change_24h': float(market.get('oneDayPriceChange', 0)),
-        'price_change_1w': float(market.get('oneWeekPriceChange', 0)),
-        'spread': float(market.get('spread', 0)),
+        'price_change_1h': _to_float(market.get('oneHourPriceChange')),
+        'price_change_24h': _to_float(market.get('oneDayPriceChange')),
+        'price_change_1w': _to_float(market.get('oneWeekPriceChange')),
+        'spread': _to_float(market.get('spread')),
         'data_source': 'polymarket',
-        'source_id': str(market.get('id', '')),
-        'slug': market.get('slug', ''),
-        'description': market.get('description', ''),
-        'market_type': market.get('marketType', ''),
+        'source_id': _to_id(market.get('id')),
+        'slug': _to_text(market.get('slug')),
+        'description': _to_text(market.get('description')),
+        'market_type': _to_text(market.get('marketType')),
     }
     
     return normalized
 
+def normalize_polymarket_batch(markets: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Vectorized equivalent of normalize_polymarket_market over a whole market list.
+    
+    Args:
+        markets: Raw Polymarket market data
+        
+    Returns:
+        DataFrame with the same columns as the per-market normalizer
+    """
+    raw = pd.DataFrame(markets, columns=_RAW_FIELDS, dtype=object)
+    
+    parsed = [_parse_outcomes(o, p) for o, p in zip(raw['outcomes'], raw['outcomePrices'])]
+    source_id = raw['id'].map(lambda v: '' if v is None or v != v else str(v))
+    closed = raw['closed'].map(bool, na_action='ignore').fillna(False).astype(bool)
+    active = raw['active'].map(bool, na_action='ignore').fillna(False).astype(bool)
+    
+    df = pd.DataFrame({
+        'market_id': source_id,
+        'title': raw['question'].fillna(''),
+        'category': raw['category'].fillna(''),
+        'outcomes': [p[0] for p in parsed],
+        'outcome_prices': [p[1] for p in parsed],
+    })
+    for col in ('last_price', 'yes_bid', 'yes_ask', 'volume_24h', 'volume_1wk',
+                'volume_1mo', 'volume_total', 'liquidity'):
+        df[col] = pd.to_numeric(raw[_NUMERIC_FIELDS[col]], errors='coerce').fillna(0.0)
+    df['close_time'] = pd.to_datetime(raw['endDate'], utc=True, errors='coerce', format='ISO8601')
+    df['open_time'] = pd.to_datetime(raw['createdAt'], utc=True, errors='coerce', format='ISO8601')
+    df['status'] = np.where(closed, 'closed', np.where(active, 'open', 'inactive'))
+    df['closed'] = closed
+    for col in ('price_change_1h', 'price_change_24h', 'price_change_1w', 'spread'):
+        df[col] = pd.to_numeric(raw[_NUMERIC_FIELDS[col]], errors='coerce').fillna(0.0)
+    df['data_source'] = 'polymarket'
+    df['source_id'] = source_id
+    for col in ('slug', 'description', 'market_type'):
+        df[col] = raw[_TEXT_FIELDS[col]].fillna('')
+    
+    return df
+
+_CLIENT: Optional[PolymarketClient] = None
+_CLIENT_LOCK = threading.Lock()
+
 def get_client() -> PolymarketClient:
     """
-    Get a Polymarket client instance.
-    Similar to the get_client() function in utils.py for Kalshi.
+    Get the shared Polymarket client instance.
+    Similar to the get_client() function in utils.py for Kalshi; the instance
+    is reused so its pooled keep-alive connections survive between calls.
     
     Returns:
         PolymarketClient instance
     """
-    return PolymarketClient()
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = PolymarketClient()
+            atexit.register(_CLIENT.session.close)
+        return _CLIENT
 
 def fetch_and_normalize_polymarket_markets(
     min_volume: float = 1000.0,
@@ -246,7 +397,19 @@ def fetch_and_normalize_polymarket_markets(
     
     print(f"📥 Raw markets fetched: {len(markets)}")
     
-    # Normalize each market
+    if not markets:
+        print("❌ No markets were normalized successfully")
+        return pd.DataFrame()
+    
+    # Normalize the whole list in one vectorized pass
+    try:
+        df = _compact_dtypes(normalize_polymarket_batch(markets))
+        print(f"✅ Normalized {len(df)} markets successfully")
+        return df
+    except Exception as e:
+        print(f"⚠️ Batch normalization failed, falling back to per-market: {e}")
+    
+    # Fallback: normalize each market individually, skipping bad records
     normalized_markets = []
     for market in markets:
         try:
@@ -258,7 +421,7 @@ def fetch_and_normalize_polymarket_markets(
     
     # Convert to DataFrame
     if normalized_markets:
-        df = pd.DataFrame(normalized_markets)
+        df = _compact_dtypes(pd.DataFrame(normalized_markets))
         print(f"✅ Normalized {len(df)} markets successfully")
         return df
     else:
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+One-time migration of the per-ticker hourly candle files
+(data/candles/candles_<TICKER>_1h.parquet) into the hive-partitioned
+dataset data/candles_1h/ticker=<TICKER>/part-0.parquet.
+
+The refresh scripts keep both layouts up to date afterwards, so this only
+needs to run once (re-running simply rewrites every partition).
+"""
+
+import os
+import sys
+
+# ── Stub out Streamlit decorators so utils can import safely ─────
+import streamlit as _st
+_st.cache_data     = lambda *args, **kwargs: (lambda f: f)
+_st.cache_resource = lambda f: f
+
+# ── Add project root to path so we can import utils ─────────────
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+import pyarrow.parquet as pq
+
+from utils import (
+    CANDLES_DIR,
+    CANDLES_DATASET_DIR,
+    write_candles_partition,
+)
+
+PREFIX, SUFFIX = "candles_", "_1h.parquet"
+
+
+def migrate_candles(candles_dir: str = CANDLES_DIR, dataset_dir: str = CANDLES_DATASET_DIR) -> int:
+    """Copy every hourly candle file into the partitioned dataset; returns files migrated."""
+    if not os.path.isdir(candles_dir):
+        print(f"❌ Candles directory not found: {candles_dir}")
+        return 0
+
+    files = sorted(f for f in os.listdir(candles_dir) if f.startswith(PREFIX) and f.endswith(SUFFIX))
+    print(f"Migrating {len(files)} hourly candle files → {dataset_dir}")
+
+    migrated = 0
+    for i, filename in enumerate(files, 1):
+        ticker = filename[len(PREFIX):-len(SUFFIX)]
+        try:
+            df = pq.read_table(os.path.join(candles_dir, filename)).to_pandas()
+            write_candles_partition(ticker, df, dataset_dir)
+            migrated += 1
+            if i % 100 == 0 or i == len(files):
+                print(f"  → [{i}/{len(files)}] migrated")
+        except Exception as e:
+            print(f"    ❌ Error migrating {ticker}: {e}")
+            continue
+
+    print(f"✅ Migrated {migrated}/{len(files)} tickers")
+    return migrated
+
+
+if __name__ == "__main__":
+    migrate_candles()
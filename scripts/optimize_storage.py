@@ -13,6 +13,8 @@ import os
 import sys
 import argparse
 import logging
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import time
 
@@ -21,11 +23,12 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 sys.path.insert(0, ROOT)
 
 import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 from utils import (
     DATA_DIR,
     CANDLES_DIR,
     analyze_parquet_performance,
-    optimize_parquet_storage,
     batch_process_parquets
 )
 
@@ -40,6 +43,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _rewrite_with_arrow(src: str, dst: str, compression: str = "zstd",
+                        row_group_size: int = 256_000) -> str:
+    """Stream a Parquet file into a recompressed copy with explicit row groups"""
+    source = pq.ParquetFile(src)
+    options = {
+        "compression": compression,
+        "use_dictionary": True,
+        "write_statistics": True,
+        "data_page_size": 1 << 20,
+    }
+    if compression == "zstd":
+        options["compression_level"] = 3
+    
+    # Buffer source batches and emit exactly row_group_size rows per group, carrying
+    # the tail into the next flush, so the layout doesn't follow the source chunking
+    with pq.ParquetWriter(dst, source.schema_arrow, **options) as writer:
+        pending, pending_rows = [], 0
+        for batch in source.iter_batches(batch_size=64_000):
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows < row_group_size:
+                continue
+            table = pa.Table.from_batches(pending, schema=source.schema_arrow)
+            offset = 0
+            while pending_rows - offset >= row_group_size:
+                writer.write_table(table.slice(offset, row_group_size), row_group_size=row_group_size)
+                offset += row_group_size
+            pending = table.slice(offset).to_batches()
+            pending_rows -= offset
+        if pending_rows:
+            writer.write_table(pa.Table.from_batches(pending, schema=source.schema_arrow))
+    
+    return dst
+
+def _optimize_file_worker(file_path: str, backup: bool, target_compression: str,
+                          original_perf: dict = None) -> dict:
+    """
+    Recompress one Parquet file in place (module-level so worker processes can
+    pickle it); log lines are returned for the parent process to emit.
+    """
+    log = []
+    
+    # Analyze original file (unless the parent already has a current analysis)
+    if original_perf is None:
+        original_perf = analyze_parquet_performance(file_path)
+    original_size = original_perf['file_size_mb']
+    
+    log.append(f"🔄 Optimizing {os.path.basename(file_path)}...")
+    log.append(f"  → Original: {original_size:.2f} MB, {original_perf['row_count']:,} rows")
+    
+    # Create backup if requested. The optimized file is swapped in with
+    # os.replace (a new inode), so a hardlink keeps the original bytes intact
+    # without copying them; fall back to a real copy across filesystems
+    if backup:
+        backup_path = file_path.replace('.parquet', '_backup.parquet')
+        if os.path.lexists(backup_path):
+            os.remove(backup_path)
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            shutil.copy2(file_path, backup_path)
+        log.append(f"  → Backup created: {os.path.basename(backup_path)}")
+    
+    # Optimize with ZSTD compression
+    optimized_path = _rewrite_with_arrow(
+        file_path,
+        file_path.replace('.parquet', f'_optimized_{target_compression}.parquet'),
+        target_compression
+    )
+    
+    # Analyze optimized file
+    optimized_perf = analyze_parquet_performance(optimized_path)
+    if "error" in optimized_perf:
+        raise RuntimeError(optimized_perf["error"])
+    
+    # Replace original with optimized version
+    os.replace(optimized_path, file_path)
+    
+    return {
+        "file_path": file_path,
+        "optimized_path": optimized_path,
+        "original_perf": original_perf,
+        "optimized_perf": optimized_perf,
+        "log": log
+    }
+
 class StorageOptimizer:
     """Optimize Parquet file storage with advanced compression"""
     
@@ -53,6 +142,44 @@ class StorageOptimizer:
             "total_savings": 0,
             "errors": []
         }
+        # Parquet analyses keyed by (path, mtime_ns, size) so a file is only
+        # re-read when it actually changes on disk
+        self._meta_cache = {}
+    
+    @staticmethod
+    def _meta_key(file_path: str, st: os.stat_result = None) -> tuple:
+        if st is None:
+            st = os.stat(file_path)
+        return (file_path, st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    def _parquet_entries(directory: str) -> list:
+        """
+        Parquet files in a directory as DirEntry objects (name, path and cached stat).
+        Backups and leftover optimizer outputs are skipped: they are written next to their
+        source file, so scheduling both in one parallel run would race on the same paths.
+        """
+        with os.scandir(directory) as it:
+            return [
+                e for e in it
+                if e.name.endswith('.parquet') and e.is_file()
+                and not e.name.endswith('_backup.parquet') and '_optimized_' not in e.name
+            ]
+    
+    def _analyze_cached(self, file_path: str, st: os.stat_result = None) -> dict:
+        """analyze_parquet_performance, memoized on the file's stat signature"""
+        key = self._meta_key(file_path, st)
+        perf_info = self._meta_cache.get(key)
+        if perf_info is None:
+            perf_info = analyze_parquet_performance(file_path)
+            if "error" not in perf_info:
+                self._meta_cache[key] = perf_info
+        return perf_info
+    
+    def _invalidate(self, file_path: str):
+        """Drop every cached analysis for a path"""
+        for key in [k for k in self._meta_cache if k[0] == file_path]:
+            del self._meta_cache[key]
     
     def analyze_directory(self, directory: str) -> dict:
         """Analyze all Parquet files in a directory"""
@@ -62,15 +189,15 @@ class StorageOptimizer:
             logger.warning(f"Directory {directory} does not exist")
             return {}
         
-        parquet_files = [f for f in os.listdir(directory) if f.endswith('.parquet')]
-        logger.info(f"Found {len(parquet_files)} Parquet files")
+        entries = self._parquet_entries(directory)
+        logger.info(f"Found {len(entries)} Parquet files")
         
         analysis_results = {}
         
-        for filename in parquet_files:
-            file_path = os.path.join(directory, filename)
+        for entry in entries:
+            filename = entry.name
             try:
-                perf_info = analyze_parquet_performance(file_path)
+                perf_info = self._analyze_cached(entry.path, entry.stat())
                 analysis_results[filename] = perf_info
                 logger.info(f"  → {filename}: {perf_info['file_size_mb']:.2f} MB, {perf_info['row_count']:,} rows")
             except Exception as e:
@@ -82,60 +209,65 @@ class StorageOptimizer:
     def optimize_file(self, file_path: str, backup: bool = True) -> dict:
         """Optimize a single Parquet file"""
         try:
-            # Analyze original file
-            original_perf = analyze_parquet_performance(file_path)
-            original_size = original_perf['file_size_mb']
-            
-            logger.info(f"🔄 Optimizing {os.path.basename(file_path)}...")
-            logger.info(f"  → Original: {original_size:.2f} MB, {original_perf['row_count']:,} rows")
-            
-            # Create backup if requested
-            if backup:
-                backup_path = file_path.replace('.parquet', '_backup.parquet')
-                import shutil
-                shutil.copy2(file_path, backup_path)
-                logger.info(f"  → Backup created: {os.path.basename(backup_path)}")
-            
-            # Optimize with ZSTD compression
-            optimized_path = optimize_parquet_storage(file_path, self.target_compression)
-            
-            # Analyze optimized file
-            optimized_perf = analyze_parquet_performance(optimized_path)
-            optimized_size = optimized_perf['file_size_mb']
-            
-            # Calculate savings
-            savings = original_size - optimized_size
-            savings_percent = (savings / original_size) * 100
-            
-            # Replace original with optimized version
-            os.replace(optimized_path, file_path)
-            
-            # Update statistics
-            self.optimization_stats["files_processed"] += 1
-            self.optimization_stats["total_original_size"] += original_size
-            self.optimization_stats["total_optimized_size"] += optimized_size
-            self.optimization_stats["total_savings"] += savings
-            
-            logger.info(f"  ✅ Optimized: {optimized_size:.2f} MB")
-            logger.info(f"  💾 Savings: {savings:.2f} MB ({savings_percent:.1f}%)")
-            
-            return {
-                "success": True,
-                "original_size": original_size,
-                "optimized_size": optimized_size,
-                "savings": savings,
-                "savings_percent": savings_percent
-            }
-            
+            outcome = _optimize_file_worker(
+                file_path, backup, self.target_compression, self._cached_perf(file_path)
+            )
         except Exception as e:
-            error_msg = f"Error optimizing {os.path.basename(file_path)}: {e}"
+            outcome = {"file_path": file_path, "log": [], "error": str(e)}
+        return self._record_outcome(outcome)
+    
+    def _cached_perf(self, file_path: str, st: os.stat_result = None):
+        """Cached analysis for a file if it is still current, else None"""
+        try:
+            return self._meta_cache.get(self._meta_key(file_path, st))
+        except OSError:
+            return None
+    
+    def _record_outcome(self, outcome: dict) -> dict:
+        """Log a worker outcome and fold it into the optimizer's stats and cache"""
+        file_path = outcome["file_path"]
+        for message in outcome["log"]:
+            logger.info(message)
+        
+        if "error" in outcome:
+            error_msg = f"Error optimizing {os.path.basename(file_path)}: {outcome['error']}"
             logger.error(error_msg)
             self.optimization_stats["errors"].append(error_msg)
             
             return {
                 "success": False,
-                "error": str(e)
+                "error": outcome["error"]
             }
+        
+        # os.replace keeps the optimized file's mtime, so its analysis can be
+        # cached under the original path
+        optimized_perf = outcome["optimized_perf"]
+        self._invalidate(file_path)
+        self._invalidate(outcome["optimized_path"])
+        if "error" not in optimized_perf:
+            self._meta_cache[self._meta_key(file_path)] = optimized_perf
+        
+        original_size = outcome["original_perf"]['file_size_mb']
+        optimized_size = optimized_perf['file_size_mb']
+        savings = original_size - optimized_size
+        savings_percent = (savings / original_size) * 100
+        
+        # Update statistics
+        self.optimization_stats["files_processed"] += 1
+        self.optimization_stats["total_original_size"] += original_size
+        self.optimization_stats["total_optimized_size"] += optimized_size
+        self.optimization_stats["total_savings"] += savings
+        
+        logger.info(f"  ✅ Optimized: {optimized_size:.2f} MB")
+        logger.info(f"  💾 Savings: {savings:.2f} MB ({savings_percent:.1f}%)")
+        
+        return {
+            "success": True,
+            "original_size": original_size,
+            "optimized_size": optimized_size,
+            "savings": savings,
+            "savings_percent": savings_percent
+        }
     
     def optimize_directory(self, directory: str, backup: bool = True, dry_run: bool = False) -> dict:
         """Optimize all Parquet files in a directory"""
@@ -145,26 +277,25 @@ class StorageOptimizer:
             logger.error(f"Directory {directory} does not exist")
             return {}
         
-        parquet_files = [f for f in os.listdir(directory) if f.endswith('.parquet')]
+        entries = self._parquet_entries(directory)
         
-        if not parquet_files:
+        if not entries:
             logger.info("No Parquet files found to optimize")
             return {}
         
-        logger.info(f"Found {len(parquet_files)} Parquet files to optimize")
-        
-        if dry_run:
-            logger.info("🔍 DRY RUN MODE - No files will be modified")
+        logger.info(f"Found {len(entries)} Parquet files to optimize")
         
         results = {}
         
-        for filename in parquet_files:
-            file_path = os.path.join(directory, filename)
+        if dry_run:
+            logger.info("🔍 DRY RUN MODE - No files will be modified")
             
-            if dry_run:
+            for entry in entries:
+                filename = entry.name
+                
                 # Just analyze in dry run mode
                 try:
-                    perf_info = analyze_parquet_performance(file_path)
+                    perf_info = self._analyze_cached(entry.path, entry.stat())
                     results[filename] = {
                         "dry_run": True,
                         "current_size": perf_info['file_size_mb'],
@@ -174,10 +305,33 @@ class StorageOptimizer:
                 except Exception as e:
                     logger.error(f"  → Error analyzing {filename}: {e}")
                     results[filename] = {"error": str(e)}
-            else:
-                # Actually optimize the file
-                result = self.optimize_file(file_path, backup=backup)
-                results[filename] = result
+            
+            return results
+        
+        # Recompression is CPU-bound and independent per file, so fan the files
+        # out across processes; stats, cache and logging stay in this process
+        if len(entries) == 1:
+            results[entries[0].name] = self.optimize_file(entries[0].path, backup=backup)
+            return results
+        
+        paths = {entry.path: entry.name for entry in entries}
+        max_workers = min(len(entries), os.cpu_count() or 1)
+        logger.info(f"  → Optimizing with {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _optimize_file_worker, entry.path, backup,
+                    self.target_compression, self._cached_perf(entry.path, entry.stat())
+                ): entry.path
+                for entry in entries
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = {"file_path": file_path, "log": [], "error": str(e)}
+                results[paths[file_path]] = self._record_outcome(outcome)
         
         return results
     
@@ -25,6 +25,7 @@ from utils import (
     get_client,
     load_series_list,
     compute_group_volumes,
+    write_candles_partition,
 )
 
 # ── Ensure data directories exist ────────────────────────────────
@@ -170,6 +171,9 @@ def refresh_candles(days: int = 30, granularity: str = "1h", min_volume: int = 1
                         # Write to parquet
                         output_path = os.path.join(candles_dir, f"candles_{ticker}_{granularity}.parquet")
                         df.to_parquet(output_path, index=False)
+                        # Keep the partitioned hourly dataset in sync
+                        if granularity == "1h":
+                            write_candles_partition(ticker, df)
                         print(f"    ✅ Wrote {len(df)} candles to {output_path}")
                     else:
                         print(f"    ⚠️ No candle data for {ticker}")
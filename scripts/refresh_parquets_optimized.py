@@ -48,6 +48,7 @@ from utils import (
     optimize_parquet_storage,
     batch_process_parquets,
     get_duckdb_performance_stats,
+    write_candles_partition,
 )
 
 # ── Configure logging ─────────────────────────────────────────────
@@ -263,6 +264,10 @@ class OptimizedParquetRefresher:
                 path = os.path.join(CANDLES_DIR, f"candles_{ticker}_{granularity}.parquet")
                 duckdb_write_optimized(df_c, path, compression="zstd", row_group_size=25000)
                 
+                # Keep the partitioned hourly dataset in sync
+                if granularity == "1h":
+                    write_candles_partition(ticker, df_c)
+                
                 # Track statistics
                 self.stats["candles_processed"] += len(df_c)
                 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script checking the vectorized helpers against the scalar code they replace:
+normalize_polymarket_batch, extract_subseries_vec and lttb_indices
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, ROOT)
+
+from polymarket_client import normalize_polymarket_batch, normalize_polymarket_market
+from pages.Series import extract_subseries, extract_subseries_vec
+from utils import lttb_indices
+
+# Raw Gamma API records covering full, sparse, None-valued and malformed fields
+SAMPLE_MARKETS = [
+    {
+        'id': 12, 'question': 'Will it rain?', 'category': 'weather', 'slug': 'rain',
+        'outcomes': '["Yes", "No"]', 'outcomePrices': '["0.4", "0.6"]',
+        'lastTradePrice': '0.41', 'bestBid': 0.4, 'bestAsk': 0.42, 'volumeNum': 123456789.12,
+        'volume24hr': 1500, 'liquidityNum': 2000.5, 'oneDayPriceChange': -0.02,
+        'createdAt': '2024-01-02T03:04:05.123Z', 'endDate': '2025-01-01T00:00:00Z',
+        'closed': False, 'active': True, 'events': [{'id': 1}],
+    },
+    {'id': 'abc', 'question': 'Closed market', 'closed': True, 'outcomes': 'not json'},
+    {'id': 'sparse'},
+    {
+        'id': None, 'question': None, 'category': None, 'outcomes': None,
+        'lastTradePrice': None, 'volumeNum': None, 'closed': None, 'active': None,
+        'endDate': None, 'createdAt': None,
+    },
+    {'id': 7, 'active': True, 'createdAt': '2024-05-06T07:08:09Z', 'endDate': 'not-a-date'},
+    {'id': 8, 'outcomes': '["A", "B", "C"]', 'outcomePrices': '["0.5", "0.5"]', 'spread': 'abc'},
+]
+
+def test_normalize_polymarket_batch():
+    """Batch normalizer matches the per-market normalizer row for row"""
+    expected = pd.DataFrame(map(normalize_polymarket_market, SAMPLE_MARKETS))
+    actual = normalize_polymarket_batch(SAMPLE_MARKETS)
+
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+def test_extract_subseries_vec():
+    """Vectorized sub-series extraction matches extract_subseries per ticker"""
+    tickers = pd.Series([
+        'KXPGATOUR-FSJC25-BCAU', 'KXPGATOUR-25AUG', 'KXPGATOUR-', 'KXPGATOUR',
+        'KXOTHER-25AUG', '', None, np.nan,
+    ], dtype=object)
+
+    for series_ticker in ('KXPGATOUR', ''):
+        # extract_subseries expects strings; missing tickers arrive as ''
+        expected = [extract_subseries(t if isinstance(t, str) else '', series_ticker) for t in tickers]
+        actual = extract_subseries_vec(tickers, series_ticker)
+        assert actual.tolist() == expected, (series_ticker, actual.tolist(), expected)
+        assert actual.index.equals(tickers.index)
+
+def test_lttb_indices():
+    """LTTB keeps both endpoints, returns n_out sorted positions, and passes short input through"""
+    x = np.arange(10_000, dtype=np.int64)
+    y = np.sin(x / 100.0)
+
+    idx = lttb_indices(x, y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+
+    assert np.array_equal(lttb_indices(x[:100], y[:100], 500), np.arange(100))
+
+if __name__ == "__main__":
+    for test in (test_normalize_polymarket_batch, test_extract_subseries_vec, test_lttb_indices):
+        print(f"🧪 {test.__name__}...")
+        test()
+        print("  ✅ passed")
+    print("\n🎉 All vectorized helper tests passed!")
@@ -3,6 +3,7 @@
 # TIMESTAMP: 2025-08-22 04:35:00 UTC
 # CACHE_KEY: 20250822043500
 
+import numpy as np
 import pandas as pd
 
 # Module import completed successfully
@@ -13,6 +14,8 @@ try:
     import datetime
     import time
     from contextlib import contextmanager
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import lru_cache
     OS_AVAILABLE = True
 except ImportError:
     OS_AVAILABLE = False
@@ -20,6 +23,8 @@ except ImportError:
     datetime = None
     time = None
     contextmanager = None
+    ThreadPoolExecutor = None
+    lru_cache = None
 
 # Add debug imports
 try:
@@ -161,6 +166,17 @@ except ImportError:
     DUCKDB_AVAILABLE = False
     duckdb = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.dataset as pads
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+    pads = None
+
 # ── Define your data directories here ─────────────────────────────
 try:
     BASE_DIR = os.path.dirname(__file__) if os else "."
@@ -188,6 +204,8 @@ try:
     ACTIVE_MARKETS_PQ = os.path.join(DATA_DIR, "active_markets.parquet") if os else "./data/active_markets.parquet"
     SUMMARY_MARKETS_PQ = os.path.join(DATA_DIR, "summary_markets.parquet") if os else "./data/summary_markets.parquet"
     CANDLES_DIR = os.path.join(DATA_DIR, "candles") if os else "./data/candles"
+    # Hourly candles as one hive-partitioned dataset: candles_1h/ticker=<TICKER>/part-0.parquet
+    CANDLES_DATASET_DIR = os.path.join(DATA_DIR, "candles_1h") if os else "./data/candles_1h"
     SERIES_VOLUMES_PQ = os.path.join(DATA_DIR, "series_volumes.parquet") if os else "./data/series_volumes.parquet"
     CHANGELOG_FILE = os.path.join(DATA_DIR, "changelog.json") if os else "./data/changelog.json"
 
@@ -198,6 +216,7 @@ except Exception:
     ACTIVE_MARKETS_PQ = "./data/active_markets.parquet"
     SUMMARY_MARKETS_PQ = "./data/summary_markets.parquet"
     CANDLES_DIR = "./data/candles"
+    CANDLES_DATASET_DIR = "./data/candles_1h"
     SERIES_VOLUMES_PQ = "./data/series_volumes.parquet"
     CHANGELOG_FILE = "./data/changelog.json"
     POLYMARKET_MARKETS_PQ = "./data/polymarket_markets.parquet"
@@ -867,10 +886,78 @@ def load_active_markets(api_key: str, page_size: int = 1000) -> pd.DataFrame:
     
     return df
 
+TIME_COLUMNS = ("open_time", "close_time", "expiration_time")
+
+def _normalize_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert open/close/expiration time columns to datetime64[ns, UTC] in place.
+    Accepts ISO strings and epoch seconds/milliseconds (>= 10^12 → ms); bad values become NaT.
+    """
+    for col in TIME_COLUMNS:
+        if col not in df.columns or pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        values = df[col]
+        epoch = pd.to_numeric(values, errors="coerce")
+        is_epoch = epoch.notna()
+        parsed = pd.to_datetime(values.where(~is_epoch), utc=True, errors="coerce", format="ISO8601")
+        if is_epoch.any():
+            seconds = epoch.where(epoch < 10**12, epoch / 1000.0)
+            parsed = parsed.where(~is_epoch, pd.to_datetime(seconds, unit="s", utc=True))
+        df[col] = parsed.astype("datetime64[ns, UTC]")
+    return df
+
 @safe_cache_data(ttl=60)
 def load_active_markets_from_store() -> pd.DataFrame:
-    # instant read from Parquet, zero API calls
-    return duckdb_read_optimized(ACTIVE_MARKETS_PQ)
+    # instant read from Parquet, zero API calls; time columns come back as UTC datetimes
+    return _normalize_time_columns(duckdb_read_optimized(ACTIVE_MARKETS_PQ))
+
+@safe_cache_data(ttl=60)
+def load_active_markets_filtered(min_volume: float = None, min_hours_to_close: float = None,
+                                 max_hours_to_close: float = None, columns: tuple = None) -> pd.DataFrame:
+    """
+    Read active markets with the volume/close-time predicates and column projection pushed
+    down into the Parquet scan, so filtered-out rows are never decoded into pandas.
+    Close-time bounds are widened by a day (with "now" floored to the hour) and only pushed
+    down for string/timestamp columns, so callers still apply their exact filters.
+    Falls back to the full store on any error.
+    """
+    try:
+        with duckdb_context() as con:
+            if con is None:
+                return load_active_markets_from_store()
+            
+            schema = {row[0]: row[1] for row in con.execute(
+                "DESCRIBE SELECT * FROM read_parquet(?)", [ACTIVE_MARKETS_PQ]).fetchall()}
+            select = [c for c in columns if c in schema] if columns else list(schema)
+            
+            where, params = [], []
+            # Same 24h volume column get_volume_columns resolves to
+            vol_col = "volume_24h" if "volume_24h" in schema else "volume"
+            if min_volume is not None and vol_col in schema:
+                where.append(f'"{vol_col}" >= ?')
+                params.append(min_volume)
+            
+            close_type = schema.get("close_time", "")
+            if close_type == "VARCHAR" or close_type.startswith("TIMESTAMP"):
+                bound = "?" if close_type == "VARCHAR" else "CAST(? AS TIMESTAMPTZ)"
+                now = pd.Timestamp.now(tz="UTC").floor("h")
+                if min_hours_to_close is not None:
+                    lower = now + pd.Timedelta(hours=min_hours_to_close) - pd.Timedelta(days=1)
+                    where.append(f"close_time >= {bound}")
+                    params.append(lower.strftime("%Y-%m-%dT%H:%M:%SZ"))
+                if max_hours_to_close is not None:
+                    upper = now + pd.Timedelta(hours=max_hours_to_close) + pd.Timedelta(days=1)
+                    where.append(f"close_time <= {bound}")
+                    params.append(upper.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            
+            cols_str = ", ".join(f'"{c}"' for c in select)
+            query = f"SELECT {cols_str} FROM read_parquet(?)"
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            return _normalize_time_columns(con.execute(query, [ACTIVE_MARKETS_PQ] + params).df())
+    except Exception as e:
+        print(f"Warning: filtered active markets read failed, loading full store: {e}")
+        return load_active_markets_from_store()
 
 @safe_cache_data(ttl=300)
 def get_summary_df_store() -> pd.DataFrame:
@@ -910,17 +997,27 @@ def get_summary_df(api_key: str, page_size: int = 1000) -> pd.DataFrame:
 
     return df
 
-def get_volume_columns(df: pd.DataFrame) -> tuple:
-    """Returns (volume_24h_series, total_volume_series) consistently across all pages"""
-    # Handle different data source structures
-    if 'data_source' in df.columns:
+@lru_cache(maxsize=64)
+def _resolve_volume_columns(columns: tuple) -> tuple:
+    """(24h volume column, total volume column) names for a column layout; None if absent."""
+    def first(*names):
+        return next((name for name in names if name in columns), None)
+
+    vol_24h_col = first("volume_24h", "volume")
+    if 'data_source' in columns:
         # Unified data - handle both Kalshi and Polymarket
-        vol_24h = df.get("volume_24h", df.get("volume"))
-        total_vol = df.get("volume_total", df.get("volume"))
+        total_col = first("volume_total", "volume")
     else:
         # Legacy Kalshi data
-        vol_24h = df.get("volume_24h", df.get("volume"))
-        total_vol = df.get("volume")
+        total_col = first("volume")
+    return vol_24h_col, total_col
+
+def get_volume_columns(df: pd.DataFrame) -> tuple:
+    """Returns (volume_24h_series, total_volume_series) consistently across all pages"""
+    # Column names are resolved once per column layout
+    vol_24h_col, total_col = _resolve_volume_columns(tuple(df.columns))
+    vol_24h = df[vol_24h_col] if vol_24h_col is not None else None
+    total_vol = df[total_col] if total_col is not None else None
     
     # Ensure we never return None - provide fallbacks
     if vol_24h is None or vol_24h.empty:
@@ -1001,6 +1098,114 @@ def load_series_list(api_key: str) -> list[dict]:
     client = KalshiClient(api_key=api_key)
     return client.get_series().get("series", [])
 
+# ── Partitioned Candle Dataset ───────────────────────────────────
+def candles_partition_path(ticker: str, dataset_dir: str = None) -> str:
+    """Path of a ticker's file in the hive-partitioned hourly candle dataset."""
+    return os.path.join(dataset_dir or CANDLES_DATASET_DIR, f"ticker={ticker}", "part-0.parquet")
+
+def write_candles_partition(ticker: str, df: pd.DataFrame, dataset_dir: str = None) -> str:
+    """
+    Write (replace) one ticker's hourly candles in the partitioned dataset.
+    The ticker lives in the directory name, so it is not stored as a column.
+    Returns the written path.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to write the candle dataset")
+    path = candles_partition_path(ticker, dataset_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df.drop(columns=["ticker"], errors="ignore"), preserve_index=False)
+    pq.write_table(_narrow_candle_table(table), path, compression="zstd")
+    return path
+
+def _narrow_candle_table(table: "pa.Table") -> "pa.Table":
+    """
+    Downcast candle columns before writing: int64 → int32 (epoch seconds, volumes) and
+    the price/bid/ask struct children to int16 (cents) or float32. Returns the table
+    unchanged if any value doesn't fit.
+    """
+    def narrow(dtype):
+        if pa.types.is_int64(dtype):
+            return pa.int32()
+        if pa.types.is_struct(dtype):
+            children = []
+            for child in dtype:
+                if pa.types.is_integer(child.type):
+                    children.append(pa.field(child.name, pa.int16()))
+                elif pa.types.is_floating(child.type):
+                    children.append(pa.field(child.name, pa.float32()))
+                else:
+                    children.append(child)
+            return pa.struct(children)
+        return dtype
+
+    schema = pa.schema([pa.field(f.name, narrow(f.type)) for f in table.schema], metadata=table.schema.metadata)
+    try:
+        return table.cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return table
+
+def _read_candles_partition(ticker: str, start_ts: int, end_ts: int):
+    """
+    Read one ticker's hourly candles from the partitioned dataset, pushing the
+    timestamp range down to the row-group statistics. Returns a pyarrow Table
+    sorted by end_period_ts, or None when the dataset doesn't have the ticker.
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    path = candles_partition_path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        table = pq.read_table(
+            path,
+            columns=["end_period_ts", "price", "volume"],
+            filters=[("end_period_ts", ">=", start_ts), ("end_period_ts", "<=", end_ts)],
+        )
+    except Exception as e:
+        print(f"Error reading candle partition for {ticker}: {e}")
+        return None
+    return table.sort_by("end_period_ts")
+
+# ── Chart Downsampling ───────────────────────────────────────────
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: positions of n_out points that keep the visual
+    shape of the (x, y) line. x must be sorted; returns every index if n_out >= len(x).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # first and last points are kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:nxt_hi].mean()
+        avg_y = y[hi:nxt_hi].mean()
+        # pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+# ── Top-N Row Selection ──────────────────────────────────────────
+def top_k_rows(df: pd.DataFrame, values, n: int) -> pd.DataFrame:
+    """Return the n rows of df with the largest values (NaN treated as 0), largest first."""
+    # Fill NaN/NA while converting to numpy, so no intermediate filled Series is built
+    arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=0.0)
+    if n < len(arr):
+        idx = np.argpartition(-arr, n - 1)[:n]
+    else:
+        idx = np.arange(len(arr))
+    idx = idx[np.argsort(-arr[idx], kind="stable")]
+    return df.iloc[idx]
+
 # ── Enhanced Candle Loading with DuckDB ──────────────────────────
 @safe_cache_data(ttl=300)
 def load_candles_from_store(
@@ -1012,9 +1217,16 @@ def load_candles_from_store(
     """
     - For '1d', reads the 1h parquet, resamples to daily.
     - Otherwise reads the exact parquet.
+    Hourly data is read from the partitioned dataset when the ticker has been migrated.
     """
     client = KalshiClient(api_key=API_KEY)
 
+    # Hourly candles come from the partitioned dataset when it has this ticker
+    if granularity in ("1h", "1d"):
+        table_h = _read_candles_partition(ticker, start_ts, end_ts)
+    else:
+        table_h = None
+
     def read_parquet(path):
         # Optimized: only select needed columns and use efficient filtering
         query = f"""
@@ -1027,21 +1239,35 @@ def load_candles_from_store(
 
     # --- DAILY: resample the 1h file ---
     if granularity == "1d":
-        path_h = os.path.join(CANDLES_DIR, f"candles_{ticker}_1h.parquet")
-        if not os.path.exists(path_h):
-            return pd.DataFrame()
-
-        df_h = read_parquet(path_h)
-        if df_h.empty:
-            return df_h
-
-        # unpack & resample...
-        df_h["timestamp"]   = pd.to_datetime(df_h["end_period_ts"], unit="s")
-        df_h["open_price"]  = df_h["price"].map(lambda p: p["open"])
-        df_h["high_price"]  = df_h["price"].map(lambda p: p["high"])
-        df_h["low_price"]   = df_h["price"].map(lambda p: p["low"])
-        df_h["close_price"] = df_h["price"].map(lambda p: p["close"])
-        df_h["volume"]      = df_h["volume"]
+        if table_h is not None:
+            if table_h.num_rows == 0:
+                return pd.DataFrame()
+            # flatten the price struct in Arrow instead of mapping dicts row by row
+            price = table_h.column("price").combine_chunks()
+            df_h = pd.DataFrame({
+                "timestamp":   pd.to_datetime(table_h.column("end_period_ts").to_numpy(), unit="s"),
+                "open_price":  price.field("open").to_numpy(zero_copy_only=False),
+                "high_price":  price.field("high").to_numpy(zero_copy_only=False),
+                "low_price":   price.field("low").to_numpy(zero_copy_only=False),
+                "close_price": price.field("close").to_numpy(zero_copy_only=False),
+                "volume":      table_h.column("volume").to_numpy(zero_copy_only=False),
+            })
+        else:
+            path_h = os.path.join(CANDLES_DIR, f"candles_{ticker}_1h.parquet")
+            if not os.path.exists(path_h):
+                return pd.DataFrame()
+
+            df_h = read_parquet(path_h)
+            if df_h.empty:
+                return df_h
+
+            # unpack & resample...
+            df_h["timestamp"]   = pd.to_datetime(df_h["end_period_ts"], unit="s")
+            df_h["open_price"]  = df_h["price"].map(lambda p: p["open"])
+            df_h["high_price"]  = df_h["price"].map(lambda p: p["high"])
+            df_h["low_price"]   = df_h["price"].map(lambda p: p["low"])
+            df_h["close_price"] = df_h["price"].map(lambda p: p["close"])
+            df_h["volume"]      = df_h["volume"]
 
         daily = (
             df_h.set_index("timestamp")
@@ -1068,6 +1294,9 @@ def load_candles_from_store(
         return daily[["end_period_ts","price","volume"]]
 
     # --- HOURLY or MINUTE: direct read with fallback to live API ---
+    if table_h is not None:
+        return table_h.to_pandas()
+
     path = os.path.join(CANDLES_DIR, f"candles_{ticker}_{granularity}.parquet")
     if not os.path.exists(path):
         payload = client.get_candlesticks(
@@ -1081,6 +1310,133 @@ def load_candles_from_store(
     # existing file → read it
     return read_parquet(path)
 
+CANDLE_FILES_BATCH_SQL = r"""
+SELECT regexp_extract(filename, 'candles_(.+)_[^_]+\.parquet$', 1) AS ticker,
+       end_period_ts, price, volume
+FROM read_parquet(?, filename=true, union_by_name=true)
+WHERE end_period_ts BETWEEN ? AND ?
+ORDER BY ticker, end_period_ts
+"""
+
+@safe_cache_data(ttl=300)
+def load_candles_from_store_batch(
+    tickers: tuple,
+    granularity: str,
+    start_ts: int,
+    end_ts: int
+) -> pd.DataFrame:
+    """
+    Candles for several tickers in one read: a long frame of
+    ticker, end_period_ts, price, volume ordered by ticker then time.
+    - Hourly: one filtered scan of the partitioned dataset, then one DuckDB pass
+      over the per-ticker files for tickers not migrated yet.
+    - Tickers with no stored file (and '1d') go through load_candles_from_store.
+    """
+    remaining = list(dict.fromkeys(str(t) for t in tickers))
+    parts = []
+
+    if granularity == "1h" and PYARROW_AVAILABLE and os.path.isdir(CANDLES_DATASET_DIR):
+        in_dataset = [t for t in remaining if os.path.exists(candles_partition_path(t))]
+        if in_dataset:
+            try:
+                dataset = pads.dataset(
+                    CANDLES_DATASET_DIR,
+                    format="parquet",
+                    partitioning=pads.partitioning(pa.schema([("ticker", pa.string())]), flavor="hive"),
+                )
+                scan_filter = (
+                    pads.field("ticker").isin(in_dataset)
+                    & (pads.field("end_period_ts") >= start_ts)
+                    & (pads.field("end_period_ts") <= end_ts)
+                )
+                table = dataset.to_table(columns=["ticker", "end_period_ts", "price", "volume"], filter=scan_filter)
+                parts.append(table.sort_by([("ticker", "ascending"), ("end_period_ts", "ascending")]).to_pandas())
+                done = set(in_dataset)
+                remaining = [t for t in remaining if t not in done]
+            except Exception as e:
+                print(f"Error scanning candle dataset: {e}")
+
+    if granularity != "1d":
+        paths = {t: os.path.join(CANDLES_DIR, f"candles_{t}_{granularity}.parquet") for t in remaining}
+        stored = [t for t in remaining if os.path.exists(paths[t])]
+        if stored:
+            try:
+                with duckdb_context() as con:
+                    if con is not None:
+                        parts.append(con.execute(
+                            CANDLE_FILES_BATCH_SQL, [[paths[t] for t in stored], start_ts, end_ts]
+                        ).df())
+                        done = set(stored)
+                        remaining = [t for t in remaining if t not in done]
+            except Exception as e:
+                print(f"Error reading candle files: {e}")
+
+    # Live API fallback / daily resample, per ticker but overlapped across a few threads
+    # (each load_candles_from_store call builds its own client, so nothing is shared)
+    def load_one(ticker):
+        return ticker, load_candles_from_store(ticker, granularity, start_ts, end_ts)
+
+    if remaining:
+        with ThreadPoolExecutor(max_workers=min(8, len(remaining))) as executor:
+            for ticker, df_t in executor.map(load_one, remaining):
+                if not df_t.empty:
+                    parts.append(df_t[["end_period_ts", "price", "volume"]].assign(ticker=ticker))
+
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        return pd.DataFrame(columns=["ticker", "end_period_ts", "price", "volume"])
+    out = pd.concat(parts, ignore_index=True)
+    out["ticker"] = out["ticker"].astype(str)
+    return out
+
+DAILY_VOLUME_SQL = """
+SELECT end_period_ts // 86400 AS day, SUM(volume) AS volume
+FROM read_parquet(?, union_by_name=true)
+WHERE end_period_ts BETWEEN ? AND ?
+GROUP BY day
+"""
+
+@safe_cache_data(ttl=300)
+def load_daily_volume_from_store(tickers: tuple, start_ts: int, end_ts: int) -> pd.DataFrame:
+    """
+    Total hourly-candle volume per UTC day across tickers, summed inside DuckDB so only
+    one row per day comes back. Returns columns date (datetime64), volume, sorted by date.
+    Tickers without a stored file go through load_candles_from_store_batch (live fetch).
+    """
+    paths, missing = [], []
+    for ticker in dict.fromkeys(str(t) for t in tickers):
+        partition = candles_partition_path(ticker)
+        legacy = os.path.join(CANDLES_DIR, f"candles_{ticker}_1h.parquet")
+        if os.path.exists(partition):
+            paths.append(partition)
+        elif os.path.exists(legacy):
+            paths.append(legacy)
+        else:
+            missing.append(ticker)
+
+    parts = []
+    if paths:
+        try:
+            with duckdb_context() as con:
+                if con is not None:
+                    parts.append(con.execute(DAILY_VOLUME_SQL, [paths, start_ts, end_ts]).df())
+        except Exception as e:
+            print(f"Error aggregating daily volume: {e}")
+    if missing:
+        live = load_candles_from_store_batch(tuple(missing), "1h", start_ts, end_ts)
+        if not live.empty:
+            parts.append(pd.DataFrame({
+                "day": pd.to_numeric(live["end_period_ts"]) // 86400,
+                "volume": live["volume"],
+            }))
+
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        return pd.DataFrame(columns=["date", "volume"])
+    daily = pd.concat(parts, ignore_index=True).groupby("day", as_index=False)["volume"].sum()
+    daily["date"] = pd.to_datetime(daily["day"] * 86400, unit="s")
+    return daily.sort_values("date")[["date", "volume"]].reset_index(drop=True)
+
 # ── Enhanced Volume Computation with DuckDB ──────────────────────
 @safe_cache_data(ttl=600)
 def compute_group_volumes(api_key: str, series_list: list[dict]) -> pd.DataFrame:
@@ -1330,44 +1686,53 @@ def make_title_clickable(title: str, ticker: str = None, key: str = None) -> boo
 
 # ── NEW: Unified Data Access Functions ─────────────────────────────────────
 
-def get_unified_markets(data_sources: list = None) -> pd.DataFrame:
-    """
-    Get markets from multiple data sources in a unified format.
-    
-    Args:
-        data_sources: List of data sources to include. Options: ['kalshi', 'polymarket']
-                     If None, returns all available sources.
-    
-    Returns:
-        DataFrame with markets from all specified sources
-    """
-    if data_sources is None:
-        data_sources = ['kalshi', 'polymarket']
-    
-    all_markets = []
-    
-    # Load Kalshi markets
-    if 'kalshi' in data_sources and os.path.exists(ACTIVE_MARKETS_PQ):
+def _load_unified_source(data_source: str):
+    """Load one source's markets for get_unified_markets; None if missing or unreadable."""
+    if data_source == 'kalshi' and os.path.exists(ACTIVE_MARKETS_PQ):
         try:
             kalshi_df = pd.read_parquet(ACTIVE_MARKETS_PQ)
             # Add source identifier
             kalshi_df['data_source'] = 'kalshi'
             kalshi_df['source_id'] = kalshi_df.get('ticker', '')
-            all_markets.append(kalshi_df)
             print(f"📊 Loaded {len(kalshi_df)} Kalshi markets")
+            return kalshi_df
         except Exception as e:
             print(f"⚠️ Error loading Kalshi markets: {e}")
     
-    # Load Polymarket markets
-    if 'polymarket' in data_sources and os.path.exists(POLYMARKET_MARKETS_PQ):
+    elif data_source == 'polymarket' and os.path.exists(POLYMARKET_MARKETS_PQ):
         try:
             polymarket_df = pd.read_parquet(POLYMARKET_MARKETS_PQ)
             # Polymarket data already has data_source field
-            all_markets.append(polymarket_df)
             print(f"📊 Loaded {len(polymarket_df)} Polymarket markets")
+            return polymarket_df
         except Exception as e:
             print(f"⚠️ Error loading Polymarket markets: {e}")
     
+    return None
+
+def get_unified_markets(data_sources: list = None) -> pd.DataFrame:
+    """
+    Get markets from multiple data sources in a unified format.
+    
+    Args:
+        data_sources: List of data sources to include. Options: ['kalshi', 'polymarket']
+                     If None, returns all available sources.
+    
+    Returns:
+        DataFrame with markets from all specified sources
+    """
+    if data_sources is None:
+        data_sources = ['kalshi', 'polymarket']
+    
+    sources = [src for src in ('kalshi', 'polymarket') if src in data_sources]
+    if len(sources) > 1:
+        # Read the source files concurrently (parquet decoding releases the GIL)
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            loaded = list(executor.map(_load_unified_source, sources))
+    else:
+        loaded = [_load_unified_source(src) for src in sources]
+    all_markets = [df for df in loaded if df is not None]
+    
     if not all_markets:
         print("❌ No markets loaded from any source")
         return pd.DataFrame()